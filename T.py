@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class IEEEAuthor:
     author_id: str = ""
     name: str = ""
@@ -19,7 +19,7 @@ class IEEEAuthor:
     #     return bool(self.author_id and self.name)
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperMetaData:
     id: str = ""
     title: str = ""
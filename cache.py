@@ -31,7 +31,12 @@ class Cacher:
         with open(path, "wb") as f:
             pickle.dump(payload, f)
 
-    def load(self, key: str) -> Optional[Any]:
+    def load(self, key: str, max_age: Optional[int] = None) -> Optional[Any]:
+        """
+        Return the object saved under key, or None if missing or expired.
+        max_age (seconds) additionally rejects entries saved longer ago,
+        whatever ttl they were saved with.
+        """
         path = self._filename(key)
         if not os.path.exists(path):
             return None
@@ -47,6 +52,9 @@ class Cacher:
                 except Exception:
                     pass
                 return None
+            if max_age is not None and (time.time() - ts) > max_age:
+                # still valid for its own ttl, just too old for this caller
+                return None
             return payload.get("obj")
         except Exception:
             # corrupted or unreadable
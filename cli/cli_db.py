@@ -8,7 +8,7 @@ from playwright.sync_api import sync_playwright
 import logging
 from cache import Cacher, make_cache_key
 from .params_mounter import mount_filtering_params
-from utils.objfilter import filter_structure, build_spec_from_args
+from utils.objfilter import filter_structure, filter_many, build_spec_from_args
 
 
 class DBPlugin(CLIPluginBase):
@@ -139,7 +139,7 @@ class DBPlugin(CLIPluginBase):
             export_obj = {"authors": authors, "papers": papers}
             if spec:
                 # apply spec to entire export object
-                export_obj = filter_structure(export_obj, spec)
+                export_obj, _ = filter_structure(export_obj, spec)
             with open(args.output, "w", encoding="utf-8") as f:
                 json.dump(export_obj, f, ensure_ascii=False, indent=2)
             print(f"Database exported to {args.output}")
@@ -152,7 +152,7 @@ class DBPlugin(CLIPluginBase):
                 items = db.get_all_papers(db_path=db_path)
             data = [utils.to_dict(i) for i in items]
             if spec:
-                data = [filter_structure(d, spec) for d in data]
+                data = filter_many(data, spec)
             print(json.dumps(data, ensure_ascii=False, indent=2))
         elif args.db_command == "unchecked":
             db_path = getattr(args, "db_path", None)
@@ -202,12 +202,12 @@ class DBPlugin(CLIPluginBase):
             if isinstance(result, list):
                 data = [utils.to_dict(r) for r in result]
                 if spec:
-                    data = [filter_structure(d, spec) for d in data]
+                    data = filter_many(data, spec)
                 print(json.dumps(data, ensure_ascii=False, indent=2))
             else:
                 data = utils.to_dict(result)
                 if spec:
-                    data = filter_structure(data, spec)
+                    data, _ = filter_structure(data, spec)
                 print(json.dumps(data, ensure_ascii=False, indent=2))
         elif args.db_command == "complete":
             db_path = getattr(args, "db_path", None)
@@ -220,23 +220,15 @@ class DBPlugin(CLIPluginBase):
             # collect targets
             targets = []
             if which in ("authors", "all"):
-                authors = db.get_unchecked_authors(db_path=db_path)
-                if authors:
-                    for aid in authors:
-                        aobj = db.get_author_by_id(aid, db_path=db_path)
-                        label = (
-                            aobj.name if aobj and getattr(aobj, "name", None) else ""
-                        )
-                        targets.append(("author", aid, label))
+                for aid in db.iter_unchecked_authors(db_path=db_path):
+                    aobj = db.get_author_by_id(aid, db_path=db_path)
+                    label = aobj.name if aobj and getattr(aobj, "name", None) else ""
+                    targets.append(("author", aid, label))
             if which in ("papers", "all"):
-                papers = db.get_unchecked_papers(db_path=db_path)
-                if papers:
-                    for pid in papers:
-                        pobj = db.get_paper_by_id(pid, db_path=db_path)
-                        label = (
-                            pobj.title if pobj and getattr(pobj, "title", None) else ""
-                        )
-                        targets.append(("paper", pid, label))
+                for pid in db.iter_unchecked_papers(db_path=db_path):
+                    pobj = db.get_paper_by_id(pid, db_path=db_path)
+                    label = pobj.title if pobj and getattr(pobj, "title", None) else ""
+                    targets.append(("paper", pid, label))
 
             if not targets:
                 print("No unchecked authors or papers found for the selected type.")
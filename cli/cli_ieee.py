@@ -1,7 +1,7 @@
 import random
 import typing
 from T import IEEEAuthor, PaperMetaData
-from ieee import AuthorPage, PublicationPage
+from ieee import AuthorPage, PublicationPage, close_http_client
 import utils as utils
 from .cli_plugin_base import CLIPluginBase
 import json
@@ -53,6 +53,8 @@ class IEEEPlugin(CLIPluginBase):
 
     def __init__(self, logger=None):
         super().__init__(logger)
+        # pages shared by every PublicationPage/AuthorPage during run()
+        self._pool: typing.Optional[utils.PagePool] = None
 
     def get_one_pub_with_cache(
         self,
@@ -67,8 +69,9 @@ class IEEEPlugin(CLIPluginBase):
         get publication info with caching
         Args:
             publication_id: The ID of the publication to fetch
-            browser: The Playwright browser instance
-            cacher: The cache manager instance
+            browser: The Playwright browser or browser context
+            cacher: The cache manager instance, also used by the page to save
+                what it fetches
             logger: The logger instance
             cache_ttl: Optional cache TTL
             hold: Whether to hold on to avoid rate limit (default True)
@@ -77,7 +80,7 @@ class IEEEPlugin(CLIPluginBase):
         """
         pubinfo: PaperMetaData = PaperMetaData()
         key = make_cache_key("pub", {"publication_id": publication_id})
-        cached = cacher.load(key)
+        cached = cacher.load(key, max_age=cache_ttl)
         if cached is not None:
             logger.info(f"Cache hit for publication {publication_id}")
             pubinfo = cached
@@ -87,11 +90,11 @@ class IEEEPlugin(CLIPluginBase):
                 st = random.randint(25, 35)
                 logger.info(f"Wait {st} seconds before fetching to avoid rate limit.")
                 time.sleep(st)  # Sleep for 20-40 seconds
-            pubpage = PublicationPage(browser, publication_id, logger)
+            # the page saves the result under the same key
+            pubpage = PublicationPage(
+                browser, publication_id, logger, self._pool, cacher, cache_ttl
+            )
             pubinfo = pubpage.fetch_info()  # type: ignore
-            if pubinfo:
-                cacher.save(key, pubinfo, ttl=cache_ttl)
-                logger.debug("Saved publication info to cache.")
 
         return pubinfo
 
@@ -141,7 +144,9 @@ class IEEEPlugin(CLIPluginBase):
             ids = getattr(author_info, "publication_ids", []) or []
         else:
             logger.info(f"Cache miss for author {args.author_id}, fetching")
-            with AuthorPage(browser, args.author_id, logger) as author:
+            with AuthorPage(
+                browser, args.author_id, logger, self._pool, cacher, ttl
+            ) as author:
                 author_info = author.get_author_info()  # type: ignore
                 if author_info:
                     ids = author.get_published_work_id_list(
@@ -236,10 +241,10 @@ class IEEEPlugin(CLIPluginBase):
             ids = cached
         else:
             logger.info(f"Cache miss for publist {args.author_id}, fetching")
-            author = AuthorPage(browser, args.author_id, logger)
-            ids = author.get_published_work_id_list(
-                start_year=args.start_year, end_year=args.end_year
-            )
+            with AuthorPage(browser, args.author_id, logger, self._pool) as author:
+                ids = author.get_published_work_id_list(
+                    start_year=args.start_year, end_year=args.end_year
+                )
             ttl = getattr(args, "cache_ttl", None)
             cacher.save(key, ids, ttl=ttl)
             logger.debug("Saved publist to cache.")
@@ -291,23 +296,30 @@ class IEEEPlugin(CLIPluginBase):
         logger = self.logger or logging.getLogger(__name__)
         playwright = sync_playwright().start()
         browser = playwright.chromium.launch(headless=False)
+        # one context for the whole run, so pages share cookies and HTTP cache
+        context = browser.new_context()
+        self._pool = utils.PagePool(context)
 
         # create cacher instance (default ttl in seconds)
         cacher = Cacher(default_ttl=86400)
 
         try:
             if args.ieee_command == "pub":
-                self._run_pub(args, browser, cacher, logger)
+                self._run_pub(args, context, cacher, logger)
             elif args.ieee_command == "author":
-                self._run_author(args, browser, cacher, logger)
+                self._run_author(args, context, cacher, logger)
             elif args.ieee_command == "publist":
-                self._run_publist(args, browser, cacher, logger)
+                self._run_publist(args, context, cacher, logger)
             else:
                 logger.error("No ieee sub-command specified. Use --help for usage.")
         except Exception as e:
             logger.error(f"An error occurred: {e}")
             raise
         finally:
+            self._pool.close()
+            self._pool = None
+            close_http_client()
+            context.close()
             browser.close()
             playwright.stop()
             logger.debug("Closing browser and stopping Playwright.")
@@ -1,10 +1,119 @@
 import json
 import logging
+import re
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from .cli_plugin_base import CLIPluginBase
 
+# one shared decoder instead of the per-call setup done by json.load/json.loads
+_DECODER = json.JSONDecoder()
+_loads = _DECODER.decode
+
+try:
+    import msgspec
+
+    _decode_json = msgspec.json.decode
+    _encode_json = msgspec.json.encode
+except ImportError:  # msgspec is optional, fall back to the standard library
+
+    def _decode_json(buf):
+        return _loads(buf.decode("utf-8"))
+
+    def _encode_json(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+# top-level arrays longer than this are worth the process pool start-up cost
+_PARALLEL_THRESHOLD = 256
+
+# --validate inputs larger than this (bytes) are re-encoded incrementally
+_STREAM_THRESHOLD = 64 * 1024 * 1024
+_STREAM_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# (prefix, suffix) of the auto-generated output filename per command type
+_AUTO_OUTPUT_NAMING = {"compress": ("compressed_", ".json"), "markdown": ("", ".md")}
+
+# Markdown heading prefix per nesting depth, headings saturate at level 6
+_HEADINGS = tuple("#" * (depth + 1) for depth in range(6))
+_SATURATED_HEADING = _HEADINGS[-1]
+
+# a JSON string literal (escapes included), or a whitespace run outside of one
+_JSON_WS_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|([\x20\t\n\r]+)', re.DOTALL)
+
+
+def _compress_bytes(buf: bytes) -> bytes:
+    """
+    Drop insignificant whitespace from raw JSON bytes without decoding them.
+    String literals and any other bytes, malformed ones included, are copied as-is.
+    """
+    out = bytearray()
+    view = memoryview(buf)
+    start = 0
+    # one match object at a time, only the output itself grows with the input
+    for m in _JSON_WS_RE.finditer(buf):
+        if m.lastindex:
+            out += view[start : m.start()]
+            start = m.end()
+    out += view[start:]
+    return bytes(out)
+
+
+def _convert_value(value, depth=1, max_depth=6):
+    """Render a single JSON value as Markdown at the given nesting depth"""
+    if depth > max_depth:
+        return f"*(max depth {max_depth} reached)*"
+
+    if isinstance(value, dict):
+        if not value:
+            return "*empty object*"
+        heading = _HEADINGS[depth] if depth < 6 else _SATURATED_HEADING
+        lines = []
+        for key, val in value.items():
+            lines.append(f"{heading} {key}\n")
+            converted = _convert_value(val, depth + 1, max_depth)
+            if isinstance(val, (dict, list)) and val:
+                lines.append(converted)
+            else:
+                lines.append(f"{converted}\n")
+        return "\n".join(lines)
+
+    elif isinstance(value, list):
+        if not value:
+            return "*empty array*"
+        return _convert_chunk(value, 0, depth, max_depth)
+
+    elif isinstance(value, str):
+        # Escape markdown special characters
+        escaped = value.replace("`", "\\`").replace("*", "\\*").replace("_", "\\_")
+        if "\n" in escaped:
+            return f"```\n{escaped}\n```"
+        return f"`{escaped}`"
+
+    elif value is None:
+        return "*null*"
+
+    elif isinstance(value, bool):
+        return f"**{str(value).lower()}**"
+
+    else:
+        return f"`{str(value)}`"
+
+
+def _convert_chunk(items, start_index, depth, max_depth):
+    """Render consecutive array items; start_index keeps "Item N" numbering global"""
+    heading = _HEADINGS[depth] if depth < 6 else _SATURATED_HEADING
+    lines = []
+    for i, item in enumerate(items, start_index):
+        if isinstance(item, (dict, list)):
+            lines.append(f"{heading} Item {i + 1}\n")
+            lines.append(_convert_value(item, depth + 1, max_depth))
+        else:
+            lines.append(f"- {_convert_value(item, depth + 1, max_depth)}")
+    return "\n".join(lines)
+
 
 class JSONPlugin(CLIPluginBase):
     name = "json"
@@ -41,6 +150,11 @@ class JSONPlugin(CLIPluginBase):
             default=6,
             help="Maximum depth for nested structures (default: 6)",
         )
+        md_parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Convert items of a large top-level array in worker processes",
+        )
 
         # compress command
         compress_parser = subparsers.add_parser(
@@ -58,21 +172,23 @@ class JSONPlugin(CLIPluginBase):
             type=str,
             help="Output JSON file (if not provided, auto-generates or writes to stdout)",
         )
+        compress_parser.add_argument(
+            "--validate",
+            action="store_true",
+            help="Parse and re-serialize the input instead of stripping whitespace bytes (slower, rejects invalid JSON)",
+        )
 
     def __init__(self, logger=None):
         super().__init__(logger)
 
     def _get_auto_output_path(self, input_path, command_type):
         """Generate automatic output filename based on input path and command type"""
-        input_path = Path(input_path)
-        stem = input_path.stem
-
-        if command_type == "compress":
-            return f"compressed_{stem}.json"
-        elif command_type == "markdown":
-            return f"{stem}.md"
-
-        return None
+        naming = _AUTO_OUTPUT_NAMING.get(command_type)
+        if naming is None:
+            return None
+        prefix, suffix = naming
+        stem = os.path.splitext(os.path.basename(input_path))[0]
+        return prefix + stem + suffix
 
     def _get_default_title(self, input_path):
         """Get default title from input filename"""
@@ -83,28 +199,26 @@ class JSONPlugin(CLIPluginBase):
     def _to_markdown(self, args, logger):
         """Convert JSON to Markdown format"""
         # Load input data
-        if hasattr(args, "input") and args.input:
+        if args.input:
             with open(args.input, "r", encoding="utf-8") as f:
-                data = json.load(f)
+                data = _loads(f.read())
                 logger.debug(f"Input data loaded from: {args.input}")
         else:
             logger.info("Reading from stdin...")
-            data = json.load(sys.stdin)
+            data = _loads(sys.stdin.read())
             logger.debug("Input data loaded from stdin")
 
         # Determine title
-        title = (
-            args.title
-            if args.title
-            else self._get_default_title(getattr(args, "input", None))
-        )
+        title = args.title if args.title else self._get_default_title(args.input)
 
         # Convert to markdown
-        markdown_content = self._json_to_markdown(data, title, args.max_depth)
+        markdown_content = self._json_to_markdown(
+            data, title, args.max_depth, args.parallel
+        )
 
         # Determine output path
         output_path = args.output
-        if not output_path and hasattr(args, "input") and args.input:
+        if not output_path and args.input:
             output_path = self._get_auto_output_path(args.input, "markdown")
             logger.info(f"Auto-generated output filename: {output_path}")
 
@@ -119,86 +233,74 @@ class JSONPlugin(CLIPluginBase):
     def _compress_json(self, args, logger):
         """Compress JSON by removing unnecessary whitespace"""
         # Load input data
-        if hasattr(args, "input") and args.input:
-            with open(args.input, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        if args.input:
+            with open(args.input, "rb") as f:
+                raw = f.read()
                 logger.debug(f"Input data loaded from: {args.input}")
         else:
             logger.info("Reading from stdin...")
-            data = json.load(sys.stdin)
+            raw = sys.stdin.buffer.read()
             logger.debug("Input data loaded from stdin")
 
-        # Compress JSON (no indentation, no separators)
-        compressed_json = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
-
         # Determine output path
         output_path = args.output
-        if not output_path and hasattr(args, "input") and args.input:
+        if not output_path and args.input:
             output_path = self._get_auto_output_path(args.input, "compress")
             logger.info(f"Auto-generated output filename: {output_path}")
 
+        if args.validate and len(raw) > _STREAM_THRESHOLD:
+            # Too large to also hold the encoded copy, write it chunk by chunk
+            logger.debug("Large input, streaming the re-encoded output")
+            chunks = _STREAM_ENCODER.iterencode(_decode_json(raw))
+            if output_path:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    f.writelines(chunks)
+                logger.info(f"Compressed JSON saved to: {output_path}")
+            else:
+                sys.stdout.writelines(chunks)
+                sys.stdout.write("\n")
+            return
+
+        if args.validate:
+            # Full round-trip (no indentation, no separators)
+            compressed_json = _encode_json(_decode_json(raw))
+        else:
+            compressed_json = _compress_bytes(raw)
+
         # Output result
         if output_path:
-            with open(output_path, "w", encoding="utf-8") as f:
+            with open(output_path, "wb") as f:
                 f.write(compressed_json)
             logger.info(f"Compressed JSON saved to: {output_path}")
         else:
-            print(compressed_json)
+            print(compressed_json.decode("utf-8"))
 
-    def _json_to_markdown(self, data, title="JSON Data", max_depth=6):
+    def _json_to_markdown(self, data, title="JSON Data", max_depth=6, parallel=False):
         """Convert JSON data to Markdown format"""
         markdown = [f"# {title}\n"]
 
-        def _convert_value(value, depth=1):
-            if depth > max_depth:
-                return f"*(max depth {max_depth} reached)*"
-
-            if isinstance(value, dict):
-                if not value:
-                    return "*empty object*"
-                lines = []
-                for key, val in value.items():
-                    lines.append(f"{'#' * min(depth + 1, 6)} {key}\n")
-                    converted = _convert_value(val, depth + 1)
-                    if isinstance(val, (dict, list)) and val:
-                        lines.append(converted)
-                    else:
-                        lines.append(f"{converted}\n")
-                return "\n".join(lines)
-
-            elif isinstance(value, list):
-                if not value:
-                    return "*empty array*"
-                lines = []
-                for i, item in enumerate(value):
-                    if isinstance(item, (dict, list)):
-                        lines.append(f"{'#' * min(depth + 1, 6)} Item {i + 1}\n")
-                        lines.append(_convert_value(item, depth + 1))
-                    else:
-                        lines.append(f"- {_convert_value(item, depth + 1)}")
-                return "\n".join(lines)
-
-            elif isinstance(value, str):
-                # Escape markdown special characters
-                escaped = (
-                    value.replace("`", "\\`").replace("*", "\\*").replace("_", "\\_")
-                )
-                if "\n" in escaped:
-                    return f"```\n{escaped}\n```"
-                return f"`{escaped}`"
-
-            elif value is None:
-                return "*null*"
-
-            elif isinstance(value, bool):
-                return f"**{str(value).lower()}**"
-
-            else:
-                return f"`{str(value)}`"
-
-        markdown.append(_convert_value(data))
+        if (
+            parallel
+            and max_depth >= 1
+            and isinstance(data, list)
+            and len(data) > _PARALLEL_THRESHOLD
+        ):
+            markdown.append(self._convert_list_parallel(data, max_depth))
+        else:
+            markdown.append(_convert_value(data, 1, max_depth))
         return "\n".join(markdown)
 
+    def _convert_list_parallel(self, data, max_depth):
+        """Convert a top-level array by fanning chunks of items out to worker processes"""
+        workers = os.cpu_count() or 1
+        size = -(-len(data) // workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_convert_chunk, data[i : i + size], i, 1, max_depth)
+                for i in range(0, len(data), size)
+            ]
+            return "\n".join(f.result() for f in futures)
+
     def run(self, args):
         logger = self.logger or logging.getLogger(__name__)
 
@@ -30,5 +30,22 @@ class CLIPluginBase:
         """
         pass
 
+    @classmethod
+    def get_parser(cls) -> argparse.ArgumentParser:
+        """
+        Return the plugin's argument parser, built once per subclass.
+        The parser has no -h of its own so it can be used as a parent parser.
+        Returns:
+            argparse.ArgumentParser: The cached parser populated by add_arguments.
+        """
+        parser = cls.__dict__.get("_parser")
+        if parser is None:
+            # prog mirrors the subcommand so nested usage lines read "main.py <name> ..."
+            parser = argparse.ArgumentParser(add_help=False)
+            parser.prog = f"{parser.prog} {cls.name}"
+            cls.add_arguments(parser)
+            cls._parser = parser
+        return parser
+
     def run(self, args):
         raise NotImplementedError("Plugin must implement run(args)")
@@ -4,9 +4,31 @@ from datetime import datetime
 import typing
 import os
 import logging
+import threading
+import functools
+import contextlib
+import itertools
+import random
+import time
+from collections import defaultdict
 from T import IEEEAuthor, PaperMetaData
 import utils
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps_indented(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # orjson is optional, fall back to the standard library
+    _loads = json.loads
+
+    def _dumps_indented(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
 raise NotImplementedError("SQlite3 based Database backend is deprecated.")
 # Switching to 2 backend, the duckdb one and the tinydb one, the current implementation will be removed in future versions.
 
@@ -18,30 +40,227 @@ DB_PATH = os.environ.get("DB_PATH", "ieee.db")
 _DEFAULT_SQLITE_TIMEOUT = 30  # seconds for sqlite connect busy timeout
 _MAX_LOCK_RETRIES = 5
 _BASE_BACKOFF = 0.2  # seconds
+# PRAGMA user_version of the current layout; 1: author lists in child tables
+_SCHEMA_VERSION = 1
+# stay below SQLite's default host parameter limit in IN (...) lists
+_SQLITE_MAX_PARAMS = 900
+# rows fetched per fetchmany() round-trip in bulk readers
+_FETCH_BATCH_SIZE = 1000
+# entries kept by the get_author_by_id cache
+_AUTHOR_CACHE_SIZE = 1024
+# distinct publication date strings kept parsed
+_PUBDATE_CACHE_SIZE = 4096
+
+# per-thread cached connections keyed by path, see get_conn()
+_tls = threading.local()
+
+# (table, value column) holding IEEEAuthor.affiliation and .publication_ids
+_AUTHOR_LIST_TABLES = (
+    ("author_affiliation", "affiliation"),
+    ("author_publication", "publication_id"),
+)
+
+# SQL text is kept in constants so the connection's statement cache can hit;
+# "{}" placeholders are filled with "?,?,..." for IN lists
+_PAPER_FIELDS = ("title", "abstract", "publication_date", "doi", "publication_title")
+_PAPER_COLUMNS = f"id, {', '.join(_PAPER_FIELDS)}"
+_SQL_GET_AUTHOR_BY_ID = 'SELECT author_id, name, "check" FROM author WHERE author_id=?'
+_SQL_GET_AUTHOR_NAME_BY_ID = "SELECT author_id, name FROM author WHERE author_id=?"
+_SQL_GET_AUTHOR_NAMES_IN = "SELECT author_id, name FROM author WHERE author_id IN ({})"
+_SQL_GET_AUTHORS_BY_NAME = "SELECT author_id, name FROM author WHERE name LIKE ?"
+_SQL_GET_AUTHORS_BY_NAME_FTS = (
+    "SELECT author_id, name FROM author "
+    "WHERE rowid IN (SELECT rowid FROM author_fts WHERE name LIKE ?) ORDER BY rowid"
+)
+_SQL_GET_ALL_AUTHORS = 'SELECT author_id, name, "check" FROM author'
+# values are merged in Python first, so an upsert just writes the resolved row
+_SQL_UPSERT_AUTHOR = (
+    'INSERT INTO author (name, "check", author_id) VALUES (?, ?, ?) '
+    'ON CONFLICT(author_id) DO UPDATE SET name=excluded.name, "check"=excluded."check"'
+)
+_SQL_GET_PAPER_BY_ID = f'SELECT {_PAPER_COLUMNS}, "check" FROM paper WHERE id=?'
+_SQL_GET_PAPER_BY_DOI = f"SELECT {_PAPER_COLUMNS} FROM paper WHERE doi=?"
+_SQL_GET_PAPERS_BY_TITLE = f"SELECT {_PAPER_COLUMNS} FROM paper WHERE title LIKE ?"
+_SQL_GET_PAPERS_BY_TITLE_FTS = (
+    f"SELECT {_PAPER_COLUMNS} FROM paper "
+    "WHERE rowid IN (SELECT rowid FROM paper_fts WHERE title LIKE ?) ORDER BY rowid"
+)
+_SQL_GET_PAPERS_IN = f'SELECT {_PAPER_COLUMNS}, "check" FROM paper WHERE id IN ({{}})'
+_SQL_GET_ALL_PAPERS = f'SELECT {_PAPER_COLUMNS}, "check" FROM paper'
+_SQL_UPSERT_PAPER = (
+    f'INSERT INTO paper ({", ".join(_PAPER_FIELDS)}, "check", id) '
+    "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(f"{f}=excluded.{f}" for f in _PAPER_FIELDS)
+    + ', "check"=excluded."check"'
+)
+_SQL_INSERT_PAPER_AUTHOR = (
+    "INSERT OR IGNORE INTO paper_author (paper_id, author_id) VALUES (?, ?)"
+)
+_SQL_GET_ANY_AUTHOR_ID_BY_PAPER = (
+    "SELECT pa.author_id FROM paper_author pa "
+    "JOIN author a ON a.author_id=pa.author_id WHERE pa.paper_id=? LIMIT 1"
+)
+_SQL_GET_PAPER_IDS_BY_AUTHOR = "SELECT paper_id FROM paper_author WHERE author_id=?"
+_SQL_GET_AUTHORS_BY_PAPER = (
+    'SELECT a.author_id, a.name, a."check" '
+    "FROM paper_author pa JOIN author a ON a.author_id=pa.author_id "
+    "WHERE pa.paper_id=? ORDER BY pa.author_id"
+)
+_SQL_GET_PAPER_AUTHORS_IN = (
+    'SELECT pa.paper_id, a.author_id, a.name, a."check" '
+    "FROM paper_author pa JOIN author a ON a.author_id=pa.author_id "
+    "WHERE pa.paper_id IN ({}) ORDER BY pa.paper_id, pa.author_id"
+)
+_SQL_GET_PAPER_IDS_BY_AUTHOR_NAME = (
+    "SELECT pa.paper_id FROM author a "
+    "JOIN paper_author pa ON pa.author_id=a.author_id "
+    "WHERE a.name LIKE ? ORDER BY a.rowid, pa.rowid"
+)
+_SQL_GET_PAPER_IDS_BY_AUTHOR_NAME_FTS = (
+    "SELECT pa.paper_id FROM author a "
+    "JOIN paper_author pa ON pa.author_id=a.author_id "
+    "WHERE a.rowid IN (SELECT rowid FROM author_fts WHERE name LIKE ?) "
+    "ORDER BY a.rowid, pa.rowid"
+)
+_SQL_EXPORT_PAPERS = (
+    "SELECT p.id, p.title, p.abstract, p.publication_date, p.doi, "
+    'p.publication_title, p."check", pa.author_id '
+    "FROM paper p LEFT JOIN paper_author pa ON pa.paper_id=p.id "
+    "ORDER BY p.rowid, pa.author_id"
+)
+_SQL_GET_ALL_PAPER_AUTHORS = (
+    'SELECT pa.paper_id, a.author_id, a.name, a."check" '
+    "FROM paper_author pa JOIN author a ON a.author_id=pa.author_id "
+    "ORDER BY pa.paper_id, pa.author_id"
+)
+# ordered like the ("check", id) covering indexes so the scan stays index-only
+_SQL_GET_UNCHECKED_AUTHORS = (
+    'SELECT author_id FROM author WHERE "check" IS NULL OR "check" != 1 '
+    'ORDER BY "check", author_id'
+)
+_SQL_GET_UNCHECKED_PAPERS = (
+    'SELECT id FROM paper WHERE "check" IS NULL OR "check" != 1 ORDER BY "check", id'
+)
+# (fts table, content table, column) trigram indexes serving LIKE '%text%'
+_FTS_TABLES = (("paper_fts", "paper", "title"), ("author_fts", "author", "name"))
+# trigram indexes only help patterns with at least this many literal characters
+_FTS_MIN_QUERY_LEN = 3
+# per child table: all rows, rows for an IN list, delete tail, insert
+_SQL_AUTHOR_LIST = {
+    table: (
+        f"SELECT author_id, {column} FROM {table} ORDER BY author_id, position",
+        f"SELECT author_id, {column} FROM {table} WHERE author_id IN ({{}}) "
+        "ORDER BY author_id, position",
+        f"DELETE FROM {table} WHERE author_id=? AND position>=?",
+        f"INSERT INTO {table} (author_id, position, {column}) VALUES (?, ?, ?)",
+    )
+    for table, column in _AUTHOR_LIST_TABLES
+}
 
 
 def get_conn(
     db_path: typing.Optional[str] = None, timeout: int = _DEFAULT_SQLITE_TIMEOUT
 ):
     """
-    Return a sqlite3.Connection with safe pragmas (WAL, busy_timeout) and given timeout.
+    Return the calling thread's sqlite3.Connection for db_path, opening it on
+    first use with safe pragmas (WAL, busy_timeout) and the given timeout.
+    Each path keeps its own connection, so using another database doesn't
+    close one a caller may still be reading from.
+    The connection runs in autocommit mode; use close_conn() to release it.
     """
     path = db_path or DB_PATH
+    conns = getattr(_tls, "conns", None)
+    if conns is None:
+        conns = _tls.conns = {}
+    cached = conns.get(path)
+    if cached is not None:
+        return cached
     # allow other threads to use same connection if necessary; set timeout to wait for locks
-    conn = sqlite3.connect(path, timeout=timeout, check_same_thread=False)
+    conn = sqlite3.connect(
+        path,
+        timeout=timeout,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256,
+    )
     try:
-        # Enable WAL to reduce writer/readers locking contention
-        conn.execute("PRAGMA journal_mode=WAL;")
-        # set synchronous to NORMAL for performance (can be adjusted)
-        conn.execute("PRAGMA synchronous=NORMAL;")
-        # busy timeout in ms
-        conn.execute(f"PRAGMA busy_timeout = {int(timeout * 1000)};")
+        # single round-trip: WAL + mmap to reduce locking and page copies
+        conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            f"PRAGMA busy_timeout={int(timeout * 1000)};"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-65536;"
+            "PRAGMA mmap_size=268435456;"
+            "PRAGMA wal_autocheckpoint=1000;"
+        )
     except Exception:
         # If pragmas fail, ignore and continue with connection
         pass
+    conns[path] = conn
     return conn
 
 
+def close_conn(db_path: typing.Optional[str] = None):
+    """
+    Close the calling thread's cached connection to db_path, or all of them
+    when no path is given.
+    """
+    conns = getattr(_tls, "conns", None)
+    if not conns:
+        return
+    paths = list(conns) if db_path is None else [db_path]
+    for path in paths:
+        conn = conns.pop(path, None)
+        if conn is not None:
+            conn.close()
+
+
+def _retry_on_locked(fn):
+    """
+    Retry fn when SQLite reports the database as locked/busy, sleeping
+    _BASE_BACKOFF * 2**attempt (with jitter) between up to _MAX_LOCK_RETRIES tries.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_MAX_LOCK_RETRIES):
+            try:
+                return fn(*args, **kwargs)
+            except sqlite3.OperationalError as e:
+                if "locked" not in str(e) or attempt == _MAX_LOCK_RETRIES - 1:
+                    raise
+                delay = _BASE_BACKOFF * (2**attempt) * (0.5 + random.random())
+                logging.getLogger(__name__).log(
+                    logging.WARNING if attempt == 0 else logging.DEBUG,
+                    f"{fn.__name__}: {e}, retry {attempt + 1}/{_MAX_LOCK_RETRIES - 1} in {delay:.2f}s",
+                )
+                time.sleep(delay)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def _write_txn(conn: sqlite3.Connection):
+    """
+    Run the block in a BEGIN IMMEDIATE transaction so the write lock is taken
+    before any read; commit on success, roll back on error. Joins the caller's
+    transaction if one is already open.
+    """
+    if conn.in_transaction:
+        yield
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    _load_author.cache_clear()
+
+
+@_retry_on_locked
 def init_db(
     db_path: typing.Optional[str] = None, logger: typing.Optional[logging.Logger] = None
 ):
@@ -54,7 +273,18 @@ def init_db(
     logger = logger or logging.getLogger(__name__)
     logger.info(f"Initializing database at {db_path or DB_PATH}")
     conn = get_conn(db_path)
-    c = conn.cursor()
+    with _write_txn(conn):
+        c = conn.cursor()
+        _create_schema(c, logger)
+        c.execute("PRAGMA user_version")
+        if c.fetchone()[0] < _SCHEMA_VERSION:
+            _migrate_author_lists(c, logger)
+            c.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+    logger.info("Database initialized.")
+
+
+def _create_schema(c: sqlite3.Cursor, logger: logging.Logger):
+    """Create tables, indexes and search indexes that do not exist yet."""
     c.execute("""
         CREATE TABLE IF NOT EXISTS author (
             author_id TEXT PRIMARY KEY,
@@ -82,6 +312,23 @@ def init_db(
             PRIMARY KEY (paper_id, author_id)
         )
     """)
+    # ordered list fields of an author, one row per element
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS author_affiliation (
+            author_id TEXT,
+            position INTEGER,
+            affiliation TEXT,
+            PRIMARY KEY (author_id, position)
+        )
+    """)
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS author_publication (
+            author_id TEXT,
+            position INTEGER,
+            publication_id TEXT,
+            PRIMARY KEY (author_id, position)
+        )
+    """)
     # ensure older DBs get the new columns if missing (safe to ignore failure)
     try:
         c.execute('ALTER TABLE author ADD COLUMN "check" INTEGER')
@@ -95,9 +342,112 @@ def init_db(
     c.execute("CREATE INDEX IF NOT EXISTS idx_doi ON paper(doi)")
     c.execute("CREATE INDEX IF NOT EXISTS idx_author_name ON author(name)")
     c.execute("CREATE INDEX IF NOT EXISTS idx_paper_title ON paper(title)")
-    conn.commit()
-    conn.close()
-    logger.info("Database initialized.")
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_author_affiliation ON author_affiliation(affiliation)"
+    )
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_author_publication ON author_publication(publication_id)"
+    )
+    # covering indexes so the unchecked scans never touch the tables
+    c.execute(
+        'CREATE INDEX IF NOT EXISTS idx_author_check ON author("check", author_id)'
+    )
+    c.execute('CREATE INDEX IF NOT EXISTS idx_paper_check ON paper("check", id)')
+    _create_fts(c, logger)
+
+
+def _create_fts(c: sqlite3.Cursor, logger: logging.Logger):
+    """
+    Create the trigram FTS5 indexes for title/name substring search, kept in
+    sync by triggers. Skipped when the SQLite build lacks FTS5 or the trigram
+    tokenizer; the getters then fall back to LIKE scans.
+    The indexes follow rowid, so rebuild them after a VACUUM.
+    """
+    for fts, table, column in _FTS_TABLES:
+        c.execute("SELECT 1 FROM sqlite_master WHERE name=?", (fts,))
+        if c.fetchone():
+            continue
+        try:
+            c.execute(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5({column}, "
+                f"content='{table}', content_rowid='rowid', tokenize='trigram')"
+            )
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 trigram index unavailable, using LIKE scans: {e}")
+            return
+        c.execute(f"""
+            CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {column}) VALUES (new.rowid, new.{column});
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column})
+                VALUES ('delete', old.rowid, old.{column});
+            END
+        """)
+        c.execute(f"""
+            CREATE TRIGGER {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column})
+                VALUES ('delete', old.rowid, old.{column});
+                INSERT INTO {fts}(rowid, {column}) VALUES (new.rowid, new.{column});
+            END
+        """)
+        # index rows that existed before the table was created
+        c.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        logger.info(f"Created {fts} search index.")
+
+
+def _rebuild_fts(c: sqlite3.Cursor):
+    """Reindex every existing FTS table from its content table."""
+    for fts, _, _ in _FTS_TABLES:
+        c.execute("SELECT 1 FROM sqlite_master WHERE name=?", (fts,))
+        if c.fetchone():
+            c.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def _search_like(c: sqlite3.Cursor, fts_sql: str, scan_sql: str, text: str):
+    """
+    Execute a '%text%' LIKE search, through the trigram index when the query is
+    long enough for it to help, otherwise (or on databases without it) as a scan.
+    """
+    pattern = f"%{text}%"
+    if len(text) >= _FTS_MIN_QUERY_LEN:
+        try:
+            return c.execute(fts_sql, (pattern,))
+        except sqlite3.OperationalError as e:
+            # only a database without the FTS table falls back; locks and
+            # index corruption must not turn into silent full scans
+            if "no such table" not in str(e):
+                raise
+    return c.execute(scan_sql, (pattern,))
+
+
+def _migrate_author_lists(c: sqlite3.Cursor, logger: logging.Logger):
+    """
+    Move JSON-encoded author.affiliation/publication_ids (older DBs) into the
+    author_affiliation/author_publication tables and clear the old columns.
+    Runs once per database, from init_db while user_version is below 1.
+    """
+    c.execute(
+        "SELECT author_id, affiliation, publication_ids FROM author "
+        "WHERE affiliation IS NOT NULL OR publication_ids IS NOT NULL"
+    )
+    rows = c.fetchall()
+    if not rows:
+        return
+    logger.info(f"Migrating list fields of {len(rows)} authors to child tables")
+    changes = [
+        (r[0], ([], []), (_load_json_list(r[1]), _load_json_list(r[2])))
+        for r in rows
+    ]
+    for table, _ in _AUTHOR_LIST_TABLES:
+        c.executemany(_SQL_AUTHOR_LIST[table][2], [(r[0], 0) for r in rows])
+    _sync_author_lists(c, changes)
+    c.execute(
+        "UPDATE author SET affiliation=NULL, publication_ids=NULL "
+        "WHERE affiliation IS NOT NULL OR publication_ids IS NOT NULL"
+    )
 
 
 def _choose_value(field_name: str, old, new, strategy: str) -> typing.Any:
@@ -137,6 +487,181 @@ def _choose_value(field_name: str, old, new, strategy: str) -> typing.Any:
         print("Please enter 'o' or 'n'.")
 
 
+def _resolve_author(
+    author: IEEEAuthor, old: typing.Optional[tuple], strategy: str
+) -> tuple:
+    """
+    Merge an incoming author with its stored (name, affiliation, publication_ids).
+    Returns:
+        tuple: (name, affiliation, publication_ids, check) to store.
+    """
+    if old is None:
+        return (
+            author.name,
+            getattr(author, "affiliation", []),
+            getattr(author, "publication_ids", []),
+            utils._compute_author_check(author),
+        )
+    old_name, old_aff, old_pub_ids = old
+    name_chosen = _choose_value("name", old_name, author.name, strategy)
+    aff_chosen = _choose_value(
+        "affiliation", old_aff, getattr(author, "affiliation", []), strategy
+    )
+    pubids_chosen = _choose_value(
+        "publication_ids", old_pub_ids, getattr(author, "publication_ids", []), strategy
+    )
+    # compute chosen checked value based on chosen fields
+    return (
+        name_chosen,
+        aff_chosen,
+        pubids_chosen,
+        utils._compute_author_check_from_fields(name_chosen, aff_chosen, pubids_chosen),
+    )
+
+
+def _load_json_list(raw) -> list:
+    try:
+        return _loads(raw) if raw else []
+    except Exception:
+        return []
+
+
+def _load_author_lists(
+    c: sqlite3.Cursor, author_ids: typing.Optional[list] = None
+) -> tuple[dict, dict]:
+    """
+    Load affiliation and publication id lists, grouped by author_id.
+    Args:
+        c (sqlite3.Cursor): Open cursor.
+        author_ids (list): Authors to load, or None for every author.
+    Returns:
+        tuple[dict, dict]: (affiliations, publication_ids) keyed by author_id.
+    """
+    lists = (defaultdict(list), defaultdict(list))
+    for (table, _), grouped in zip(_AUTHOR_LIST_TABLES, lists):
+        select_all, select_in = _SQL_AUTHOR_LIST[table][:2]
+        if author_ids is None:
+            rows = _iter_rows(c.execute(select_all))
+        else:
+            rows = []
+            for chunk in _chunks(list(author_ids)):
+                c.execute(select_in.format(_placeholders(len(chunk))), chunk)
+                rows.extend(c.fetchall())
+        for aid, value in rows:
+            grouped[aid].append(value)
+    return lists
+
+
+def _sync_author_lists(c: sqlite3.Cursor, changes: list):
+    """
+    Write author list fields to the child tables.
+    Args:
+        c (sqlite3.Cursor): Open cursor.
+        changes (list): (author_id, (old_aff, old_pub_ids), (new_aff, new_pub_ids));
+            only rows after the common prefix of old and new are rewritten.
+    """
+    for i, (table, _) in enumerate(_AUTHOR_LIST_TABLES):
+        deletes, inserts = [], []
+        for aid, old, new in changes:
+            old_vals, new_vals = old[i], new[i]
+            k = 0
+            limit = min(len(old_vals), len(new_vals))
+            while k < limit and old_vals[k] == new_vals[k]:
+                k += 1
+            if k < len(old_vals):
+                deletes.append((aid, k))
+            inserts.extend((aid, pos, new_vals[pos]) for pos in range(k, len(new_vals)))
+        c.executemany(_SQL_AUTHOR_LIST[table][2], deletes)
+        c.executemany(_SQL_AUTHOR_LIST[table][3], inserts)
+
+
+def _pubdate_to_str(pubdate) -> typing.Optional[str]:
+    """Normalize a publication date to the ISO string stored in the paper table."""
+    if isinstance(pubdate, datetime):
+        return pubdate.isoformat()
+    if pubdate is not None:
+        return str(pubdate)
+    return None
+
+
+def _resolve_paper(paper: PaperMetaData, old: typing.Optional[tuple], strategy: str):
+    """
+    Merge an incoming paper with its stored
+    (title, abstract, publication_date, doi, publication_title, check).
+    Returns:
+        tuple: (title, abstract, publication_date, doi, publication_title, check).
+    """
+    if old is None:
+        return (
+            paper.title,
+            paper.abstract,
+            _pubdate_to_str(paper.publication_date),
+            paper.doi,
+            paper.publication_title,
+            utils._compute_paper_check(paper),
+        )
+    old_title, old_abstract, old_pubdate, old_doi, old_pubtitle, old_check = old
+    title_chosen = _choose_value("title", old_title, paper.title, strategy)
+    abstract_chosen = _choose_value("abstract", old_abstract, paper.abstract, strategy)
+    pubdate_chosen = _choose_value(
+        "publication_date",
+        old_pubdate,
+        _pubdate_to_str(paper.publication_date),
+        strategy,
+    )
+    doi_chosen = _choose_value("doi", old_doi, paper.doi, strategy)
+    pubtitle_chosen = _choose_value(
+        "publication_title", old_pubtitle, paper.publication_title, strategy
+    )
+    chosen = (
+        title_chosen,
+        abstract_chosen,
+        pubdate_chosen,
+        doi_chosen,
+        pubtitle_chosen,
+    )
+    authors = getattr(paper, "authors", [])
+    # no field changed: a stored 1 means every field was already set, and
+    # without authors the check is always 0, so the stored value still holds
+    if chosen == old[:5] and old_check == (1 if authors else 0):
+        checked = old_check
+    else:
+        # an unset date used to be filled with now() here, so it counts as set
+        checked = utils._compute_paper_check_from_fields(
+            title_chosen,
+            abstract_chosen,
+            authors,
+            doi_chosen,
+            pubtitle_chosen,
+            pubdate_chosen or True,
+        )
+    return (
+        title_chosen,
+        abstract_chosen,
+        pubdate_chosen,
+        doi_chosen,
+        pubtitle_chosen,
+        checked,
+    )
+
+
+def _iter_rows(c: sqlite3.Cursor) -> typing.Iterator[tuple]:
+    """Iterate an executed cursor in fetchmany() batches of _FETCH_BATCH_SIZE."""
+    c.arraysize = _FETCH_BATCH_SIZE
+    while rows := c.fetchmany():
+        yield from rows
+
+
+def _placeholders(n: int) -> str:
+    return ",".join("?" * n)
+
+
+def _chunks(seq: list, size: int = _SQLITE_MAX_PARAMS):
+    for i in range(0, len(seq), size):
+        yield seq[i : i + size]
+
+
+@_retry_on_locked
 def save_or_update_author(
     author: IEEEAuthor,
     db_path: typing.Optional[str] = None,
@@ -157,93 +682,132 @@ def save_or_update_author(
     logger.debug(f"Upserting author {author.author_id} with strategy={strategy}")
     conn = aconn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        "SELECT author_id, name, affiliation, publication_ids FROM author WHERE author_id=?",
-        (author.author_id,),
-    )
-    row = c.fetchone()
-    author_checked = utils._compute_author_check(author)
-    if not row:
-        logger.info(f"Author {author.author_id} not found, inserting.")
-        c.execute(
-            """
-            INSERT INTO author (author_id, name, affiliation, publication_ids, "check")
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                author.author_id,
-                author.name,
-                json.dumps(getattr(author, "affiliation", [])),
-                json.dumps(getattr(author, "publication_ids", [])),
-                author_checked,
-            ),
+    # read and write under one write lock so a concurrent writer can't slip in between
+    with _write_txn(conn):
+        c.execute(_SQL_GET_AUTHOR_NAME_BY_ID, (author.author_id,))
+        row = c.fetchone()
+        if not row:
+            logger.info(f"Author {author.author_id} not found, inserting.")
+            name, aff, pub_ids, checked = _resolve_author(author, None, strategy)
+            c.execute(_SQL_UPSERT_AUTHOR, (name, checked, author.author_id))
+            _sync_author_lists(c, [(author.author_id, ([], []), (aff, pub_ids))])
+            logger.info(f"Author {author.author_id} inserted.")
+            return
+
+        # exists -> compare and decide per-field
+        affs, pubs = _load_author_lists(c, [author.author_id])
+        old_lists = (affs[author.author_id], pubs[author.author_id])
+        name, aff, pub_ids, checked = _resolve_author(
+            author, (row[1],) + old_lists, strategy
         )
-        conn.commit()
-        if aconn is None:
-            conn.close()
-        logger.info(f"Author {author.author_id} inserted.")
-        return
+        logger.info(f"Updating author {author.author_id}")
+        c.execute(_SQL_UPSERT_AUTHOR, (name, checked, author.author_id))
+        _sync_author_lists(c, [(author.author_id, old_lists, (aff, pub_ids))])
+    logger.debug(f"Author {author.author_id} updated.")
 
-    # exists -> compare and decide
-    old_name = row[1]
-    try:
-        old_aff = json.loads(row[2]) if row[2] else []
-    except Exception:
-        old_aff = []
-    try:
-        old_pub_ids = json.loads(row[3]) if row[3] else []
-    except Exception:
-        old_pub_ids = []
 
-    # decide per-field
-    name_chosen = _choose_value("name", old_name, author.name, strategy)
-    aff_chosen = _choose_value(
-        "affiliation", old_aff, getattr(author, "affiliation", []), strategy
-    )
-    pubids_chosen = _choose_value(
-        "publication_ids", old_pub_ids, getattr(author, "publication_ids", []), strategy
-    )
+# keep backward-compatible save_author calling the new function (default AN)
+def save_author(author: IEEEAuthor, db_path: typing.Optional[str] = None):
+    return save_or_update_author(author, db_path=db_path, strategy="AN")
 
-    # compute chosen checked value based on chosen fields
-    chosen_author = IEEEAuthor(
-        author_id=author.author_id, name=name_chosen, affiliation=aff_chosen
-    )
-    try:
-        chosen_author.publication_ids = pubids_chosen
-    except Exception:
-        pass
-    chosen_checked = utils._compute_author_check(chosen_author)
-
-    # update if any change
-    if (
-        name_chosen != old_name
-        or aff_chosen != old_aff
-        or pubids_chosen != old_pub_ids
-        or chosen_checked != (row[3] if len(row) > 3 else 0)
-    ):
-        logger.info(f"Updating author {author.author_id}")
-        c.execute(
-            'UPDATE author SET name=?, affiliation=?, publication_ids=?, "check"=? WHERE author_id=?',
-            (
-                name_chosen,
-                json.dumps(aff_chosen),
-                json.dumps(pubids_chosen),
-                chosen_checked,
-                author.author_id,
-            ),
+
+def _write_papers(
+    c: sqlite3.Cursor,
+    papers: list[PaperMetaData],
+    strategy: str,
+    logger: logging.Logger,
+) -> int:
+    """
+    Upsert papers and their authors on a cursor inside an open write transaction.
+    Returns:
+        int: Number of distinct papers written.
+    """
+    # pre-fetch existing rows, chunked below SQLite's host parameter limit
+    paper_ids = list(dict.fromkeys(p.id for p in papers))
+    author_ids = list(
+        dict.fromkeys(
+            a.author_id for p in papers for a in getattr(p, "authors", [])
         )
-        conn.commit()
-        logger.debug(f"Author {author.author_id} updated.")
-    else:
-        logger.debug(f"No changes for author {author.author_id}.")
+    )
+    old_papers = {}
+    for chunk in _chunks(paper_ids):
+        c.execute(_SQL_GET_PAPERS_IN.format(_placeholders(len(chunk))), chunk)
+        for r in c.fetchall():
+            old_papers[r[0]] = r[1:]
+    old_authors = {}
+    affs, pubs = _load_author_lists(c, author_ids)
+    for chunk in _chunks(author_ids):
+        c.execute(_SQL_GET_AUTHOR_NAMES_IN.format(_placeholders(len(chunk))), chunk)
+        for r in c.fetchall():
+            old_authors[r[0]] = (r[1], affs[r[0]], pubs[r[0]])
+
+    # resolve in input order so later papers see earlier results
+    stored_lists = {aid: (v[1], v[2]) for aid, v in old_authors.items()}
+    paper_state, author_state, links = {}, {}, []
+    for paper in papers:
+        if paper.id in old_papers:
+            logger.info(
+                f"Paper {paper.id} exists, resolving conflicts with strategy={strategy}"
+            )
+        else:
+            logger.info(f"Inserting new paper {paper.id}")
+        resolved = _resolve_paper(paper, old_papers.get(paper.id), strategy)
+        old_papers[paper.id] = resolved
+        paper_state[paper.id] = resolved
+        for author in getattr(paper, "authors", []):
+            resolved = _resolve_author(
+                author, old_authors.get(author.author_id), strategy
+            )
+            old_authors[author.author_id] = resolved[:3]
+            author_state[author.author_id] = resolved
+            links.append((paper.id, author.author_id))
 
-    if aconn is None:  # if we create a conn close it, else just do nothing
-        conn.close()
+    def _paper_row(pid):
+        return paper_state[pid] + (pid,)
 
+    def _author_row(aid):
+        name, _, _, checked = author_state[aid]
+        return (name, checked, aid)
 
-# keep backward-compatible save_author calling the new function (default AN)
-def save_author(author: IEEEAuthor, db_path: typing.Optional[str] = None):
-    return save_or_update_author(author, db_path=db_path, strategy="AN")
+    c.executemany(_SQL_UPSERT_PAPER, [_paper_row(pid) for pid in paper_state])
+    c.executemany(_SQL_UPSERT_AUTHOR, [_author_row(aid) for aid in author_state])
+    _sync_author_lists(
+        c,
+        [
+            (aid, stored_lists.get(aid, ([], [])), state[1:3])
+            for aid, state in author_state.items()
+        ],
+    )
+    c.executemany(_SQL_INSERT_PAPER_AUTHOR, links)
+    return len(paper_state)
+
+
+@_retry_on_locked
+def save_papers_bulk(
+    papers: list[PaperMetaData],
+    db_path: typing.Optional[str] = None,
+    strategy: str = "AN",
+    logger: typing.Optional[logging.Logger] = None,
+):
+    """
+    Save or update many papers and their authors in a single transaction.
+    Existing rows are fetched up front, conflicts are resolved in Python in
+    input order (same rules as save_paper), then all rows are written with
+    executemany and committed once.
+    Args:
+        papers (list[PaperMetaData]): Papers to save.
+        db_path (str): Optional database path.
+        strategy (str): Conflict resolution strategy, AO/AN/M.
+        logger (logging.Logger): Optional logger to use.
+    """
+    logger = logger or logging.getLogger(__name__)
+    if not papers:
+        return
+    logger.debug(f"Saving {len(papers)} papers with strategy={strategy}")
+    conn = get_conn(db_path)
+    with _write_txn(conn):
+        count = _write_papers(conn.cursor(), papers, strategy, logger)
+    logger.info(f"{count} papers saved/updated.")
 
 
 def save_paper(
@@ -256,117 +820,54 @@ def save_paper(
     Save or update a paper and its authors.
     Strategy applies when updating existing paper fields and author upserts.
     """
+    save_papers_bulk([paper], db_path=db_path, strategy=strategy, logger=logger)
+
+
+def import_bulk(
+    papers: list[PaperMetaData],
+    db_path: typing.Optional[str] = None,
+    strategy: str = "AN",
+    logger: typing.Optional[logging.Logger] = None,
+):
+    """
+    Import papers into a new database file: everything is written to an
+    in-memory database first and copied to disk with a single VACUUM INTO,
+    instead of journaling every write. If the database already has content
+    the papers are merged into it with save_papers_bulk instead.
+    Args:
+        papers (list[PaperMetaData]): Papers to import.
+        db_path (str): Optional database path.
+        strategy (str): Conflict resolution strategy, AO/AN/M.
+        logger (logging.Logger): Optional logger to use.
+    """
     logger = logger or logging.getLogger(__name__)
-    logger.debug(f"Saving paper {paper.id} with strategy={strategy}")
+    path = db_path or DB_PATH
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        logger.info(f"{path} already has data, merging {len(papers)} papers in place")
+        save_papers_bulk(papers, db_path=db_path, strategy=strategy, logger=logger)
+        return
+    # a cached connection may hold a WAL for the empty file
+    close_conn(path)
+    logger.info(f"Staging {len(papers)} papers in memory for {path}")
+    mem = sqlite3.connect(":memory:", isolation_level=None)
+    try:
+        with _write_txn(mem):
+            c = mem.cursor()
+            _create_schema(c, logger)
+            c.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+            count = _write_papers(c, papers, strategy, logger)
+        mem.execute("VACUUM INTO ?", (path,))
+    finally:
+        mem.close()
+    # VACUUM may renumber implicit rowids, which the FTS indexes point at
     conn = get_conn(db_path)
-    c = conn.cursor()
-    # check existing paper
-    c.execute(
-        "SELECT id, title, abstract, publication_date, doi, publication_title FROM paper WHERE id=?",
-        (paper.id,),
-    )
-    row = c.fetchone()
-    paper_checked = utils._compute_paper_check(paper)
-    if not row:
-        logger.info(f"Inserting new paper {paper.id}")
-        c.execute(
-            """
-            INSERT INTO paper (id, title, abstract, publication_date, doi, publication_title, "check")
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                paper.id,
-                paper.title,
-                paper.abstract,
-                paper.publication_date.isoformat()
-                if isinstance(paper.publication_date, datetime)
-                else (
-                    str(paper.publication_date)
-                    if paper.publication_date is not None
-                    else None
-                ),
-                paper.doi,
-                paper.publication_title,
-                paper_checked,
-            ),
-        )
-    else:
-        logger.info(
-            f"Paper {paper.id} exists, resolving conflicts with strategy={strategy}"
-        )
-        # existing -> compare fields and decide
-        old_title = row[1]
-        old_abstract = row[2]
-        old_pubdate = row[3]
-        old_doi = row[4]
-        old_pubtitle = row[5]
-
-        # normalize incoming pubdate to iso string or None
-        new_pubdate = None
-        if isinstance(paper.publication_date, datetime):
-            new_pubdate = paper.publication_date.isoformat()
-        elif paper.publication_date is not None:
-            new_pubdate = str(paper.publication_date)
-
-        title_chosen = _choose_value("title", old_title, paper.title, strategy)
-        abstract_chosen = _choose_value(
-            "abstract", old_abstract, paper.abstract, strategy
-        )
-        pubdate_chosen = _choose_value(
-            "publication_date", old_pubdate, new_pubdate, strategy
-        )
-        doi_chosen = _choose_value("doi", old_doi, paper.doi, strategy)
-        pubtitle_chosen = _choose_value(
-            "publication_title", old_pubtitle, paper.publication_title, strategy
-        )
-
-        c.execute(
-            'UPDATE paper SET title=?, abstract=?, publication_date=?, doi=?, publication_title=?, "check"=? WHERE id=?',
-            (
-                title_chosen,
-                abstract_chosen,
-                pubdate_chosen,
-                doi_chosen,
-                pubtitle_chosen,
-                utils._compute_paper_check(
-                    PaperMetaData(
-                        id=paper.id,
-                        title=title_chosen,
-                        abstract=abstract_chosen,
-                        authors=getattr(paper, "authors", []),
-                        doi=doi_chosen,
-                        publication_title=pubtitle_chosen,
-                        publication_date=(
-                            datetime.fromisoformat(pubdate_chosen)
-                            if pubdate_chosen
-                            else datetime.now()
-                        ),
-                    )
-                ),
-                paper.id,
-            ),
-        )
-        logger.debug(f"Paper {paper.id} fields chosen and updated.")
-
-    logger.info(f"Paper {paper.id} saved/updated.")
-    # upsert authors and paper_author relations
-    for author in getattr(paper, "authors", []):
-        # retry-wrapped author upsert to handle locks
-        save_or_update_author(
-            author, db_path=db_path, strategy=strategy, logger=logger, aconn=conn
-        )
-        c.execute(
-            """
-            INSERT OR IGNORE INTO paper_author (paper_id, author_id)
-            VALUES (?, ?)
-            """,
-            (paper.id, author.author_id),
-        )
-    conn.commit()
-    conn.close()
+    with _write_txn(conn):
+        _rebuild_fts(conn.cursor())
+    logger.info(f"{count} papers imported into {path}.")
 
 
-# provide an update_paper wrapper for compatibility (calls new save_paper with strategy)
+# provide an update_paper wrapper for compatibility (same merge rules as save_paper)
+@_retry_on_locked
 def update_paper(
     paper_id: str, db_path: typing.Optional[str] = None, strategy: str = "AN", **kwargs
 ):
@@ -377,442 +878,523 @@ def update_paper(
         db_path (str): Optional database path.
         **kwargs: Fields to update.
     """
-    # This compatibility wrapper will fetch the paper, apply kwargs and call save_paper
-    pm = get_paper_by_id(paper_id, db_path=db_path)
-    if pm is None:
-        # nothing to update, create minimal
-        pm = PaperMetaData(
-            id=paper_id,
-        )
-    # apply kwargs to pm
-    for k, v in kwargs.items():
-        if k == "publication_date" and isinstance(v, datetime):
-            setattr(pm, k, v)
-        else:
-            setattr(pm, k, v)
-    save_paper(pm, db_path=db_path, strategy=strategy)
+    conn = get_conn(db_path)
+    c = conn.cursor()
+    with _write_txn(conn):
+        c.execute(_SQL_GET_PAPER_BY_ID, (paper_id,))
+        row = c.fetchone()
+        if row is not None and kwargs.keys() <= set(_PAPER_FIELDS):
+            # plain column edits: merge just those fields and UPDATE in place
+            old = dict(zip(_PAPER_FIELDS, row[1:6]))
+            changes = {}
+            for k, v in kwargs.items():
+                new = _pubdate_to_str(v) if k == "publication_date" else v
+                chosen = _choose_value(k, old[k], new, strategy)
+                if chosen != old[k]:
+                    changes[k] = chosen
+            merged = {**old, **changes}
+            c.execute(_SQL_GET_ANY_AUTHOR_ID_BY_PAPER, (paper_id,))
+            # an unset date counts as set, as in _resolve_paper
+            checked = utils._compute_paper_check_from_fields(
+                merged["title"],
+                merged["abstract"],
+                [r[0] for r in c.fetchall()],
+                merged["doi"],
+                merged["publication_title"],
+                merged["publication_date"] or True,
+            )
+            if not changes and checked == row[6]:
+                return
+            sets = "".join(f"{k}=?, " for k in changes)
+            c.execute(
+                f'UPDATE paper SET {sets}"check"=? WHERE id=?',
+                (*changes.values(), checked, paper_id),
+            )
+            return
+
+        # otherwise fetch the paper, apply kwargs and save it through the merge path,
+        # still in the one transaction so the read can't go stale before the write
+        pm = get_paper_by_id(paper_id, db_path=db_path, conn=conn)
+        if pm is None:
+            # nothing to update, create minimal
+            pm = PaperMetaData(
+                id=paper_id,
+            )
+        # apply kwargs to pm
+        for k, v in kwargs.items():
+            if k == "publication_date" and isinstance(v, datetime):
+                setattr(pm, k, v)
+            else:
+                setattr(pm, k, v)
+        _write_papers(conn.cursor(), [pm], strategy, logging.getLogger(__name__))
+
+
+def _row_to_author(row, lists: tuple[dict, dict]) -> IEEEAuthor:
+    """
+    Build an IEEEAuthor from an (author_id, name, check) row and the
+    (affiliations, publication_ids) mappings from _load_author_lists.
+    """
+    affs, pubs = lists
+    return IEEEAuthor(
+        author_id=row[0],
+        name=row[1],
+        affiliation=list(affs.get(row[0], ())),
+        publication_ids=list(pubs.get(row[0], ())),
+        check=row[2] if row[2] is not None else 0,
+    )
+
+
+def _authors_for_paper(c: sqlite3.Cursor, paper_id: str) -> list[IEEEAuthor]:
+    """Load a paper's authors with one joined query on an open cursor."""
+    c.execute(_SQL_GET_AUTHORS_BY_PAPER, (paper_id,))
+    rows = c.fetchall()
+    lists = _load_author_lists(c, [r[0] for r in rows])
+    return [_row_to_author(r, lists) for r in rows]
+
+
+# papers share a small set of publication dates and datetimes are immutable,
+# so a parsed value can be handed to every paper that has the same string
+_parse_pubdate = functools.lru_cache(maxsize=_PUBDATE_CACHE_SIZE)(
+    datetime.fromisoformat
+)
+
+
+def _row_to_paper(paper_row, authors: list[IEEEAuthor]) -> PaperMetaData:
+    """
+    Build a PaperMetaData from an (id, title, abstract, publication_date, doi,
+    publication_title[, check]) row.
+    """
+    pm = PaperMetaData(
+        id=paper_row[0],
+        title=paper_row[1],
+        abstract=paper_row[2],
+        authors=authors,
+        doi=paper_row[4],
+        publication_title=paper_row[5],
+        check=paper_row[6] if len(paper_row) > 6 and paper_row[6] is not None else 0,
+    )
+    if paper_row[3]:
+        pm.publication_date = _parse_pubdate(paper_row[3])
+    return pm
+
+
+def _authors_by_paper(c: sqlite3.Cursor, paper_ids: list) -> dict[str, list]:
+    """Load the authors of many papers with batched IN queries, keyed by paper id."""
+    author_rows = defaultdict(list)
+    for chunk in _chunks(list(dict.fromkeys(paper_ids))):
+        c.execute(_SQL_GET_PAPER_AUTHORS_IN.format(_placeholders(len(chunk))), chunk)
+        for r in c.fetchall():
+            author_rows[r[0]].append(r[1:])
+    lists = _load_author_lists(
+        c, list(dict.fromkeys(r[0] for rows in author_rows.values() for r in rows))
+    )
+    return defaultdict(
+        list,
+        {
+            pid: [_row_to_author(r, lists) for r in rows]
+            for pid, rows in author_rows.items()
+        },
+    )
+
+
+def _papers_by_ids(c: sqlite3.Cursor, paper_ids: list) -> list[PaperMetaData]:
+    """
+    Load papers (with authors) for paper_ids using batched IN queries.
+    Order and duplicates of paper_ids are kept; unknown ids are skipped.
+    """
+    paper_rows = {}
+    for chunk in _chunks(list(dict.fromkeys(paper_ids))):
+        c.execute(_SQL_GET_PAPERS_IN.format(_placeholders(len(chunk))), chunk)
+        for r in c.fetchall():
+            paper_rows[r[0]] = r
+    authors = _authors_by_paper(c, list(paper_rows))
+    return [
+        _row_to_paper(paper_rows[pid], authors[pid])
+        for pid in paper_ids
+        if pid in paper_rows
+    ]
+
+
+@functools.lru_cache(maxsize=_AUTHOR_CACHE_SIZE)
+def _load_author(author_id: str, db_path: typing.Optional[str]):
+    """
+    Fetch an author as an immutable
+    ((author_id, name, check), affiliation, publication_ids) record.
+    Cached; every write in this module clears the cache.
+    """
+    return _fetch_author(get_conn(db_path).cursor(), author_id)
+
+
+def _fetch_author(c: sqlite3.Cursor, author_id: str):
+    c.execute(_SQL_GET_AUTHOR_BY_ID, (author_id,))
+    row = c.fetchone()
+    if row is None:
+        return None
+    affs, pubs = _load_author_lists(c, [author_id])
+    return row, tuple(affs[author_id]), tuple(pubs[author_id])
 
 
 def get_author_by_id(
     author_id: str,
     db_path: typing.Optional[str] = None,
     logger: typing.Optional[logging.Logger] = None,
+    cache: bool = True,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> IEEEAuthor | None:
     """
     Retrieve an author by their ID.
     Args:
         author_id (str): The ID of the author.
         db_path (str): Optional database path.
+        cache (bool): Serve repeated lookups from the in-process cache (default True).
+            Disable when another process may have written to the database.
+        conn (sqlite3.Connection): Optional connection to reuse for the query;
+            bypasses the cache so reads inside an open transaction see its writes.
     Returns:
         IEEEAuthor or None: The author object if found, else None.
     """
     logger = logger or logging.getLogger(__name__)
     logger.debug(f"Query author by id: {author_id}")
-    conn = get_conn(db_path)
-    c = conn.cursor()
-    c.execute(
-        'SELECT author_id, name, affiliation, publication_ids, "check" FROM author WHERE author_id=?',
-        (author_id,),
-    )
-    row = c.fetchone()
-    conn.close()
-    if row:
-        aff = json.loads(row[2]) if row[2] else []
-        pub_ids = json.loads(row[3]) if row[3] else []
-        author = IEEEAuthor(row[0], row[1], aff)
-        try:
-            author.publication_ids = pub_ids
-        except Exception:
-            pass
-        try:
-            author.check = int(row[4]) if row[4] is not None else 0
-        except Exception:
-            pass
-        return author
-    return None
+    if conn is not None:
+        record = _fetch_author(conn.cursor(), author_id)
+    else:
+        load = _load_author if cache else _load_author.__wrapped__
+        record = load(author_id, db_path)
+    if record is None:
+        return None
+    # build a fresh object so callers can't mutate the cached record
+    row, aff, pub_ids = record
+    return _row_to_author(row, ({author_id: aff}, {author_id: pub_ids}))
 
 
 def get_author_by_name(
-    name: str, db_path: typing.Optional[str] = None
+    name: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> list[IEEEAuthor]:
     """
     Retrieve authors whose names match the given string.
     Args:
         name (str): The name or partial name to search for.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[IEEEAuthor]: List of matching authors.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        "SELECT author_id, name, affiliation, publication_ids FROM author WHERE name LIKE ?",
-        (f"%{name}%",),
-    )
+    _search_like(c, _SQL_GET_AUTHORS_BY_NAME_FTS, _SQL_GET_AUTHORS_BY_NAME, name)
     rows = c.fetchall()
-    conn.close()
-    result = []
-    for r in rows:
-        aff = json.loads(r[2]) if r[2] else []
-        pub_ids = json.loads(r[3]) if r[3] else []
-        author = IEEEAuthor(r[0], r[1], aff)
-        try:
-            author.publication_ids = pub_ids
-        except Exception:
-            pass
-        result.append(author)
-    return result
+    lists = _load_author_lists(c, [r[0] for r in rows])
+    # check is not part of this query, authors come back with the default
+    return [_row_to_author((r[0], r[1], None), lists) for r in rows]
 
 
 def get_paper_by_doi(
-    doi: str, db_path: typing.Optional[str] = None
+    doi: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> PaperMetaData | None:
     """
     Retrieve a paper by its DOI.
     Args:
         doi (str): The DOI of the paper.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         PaperMetaData or None: The paper object if found, else None.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        "SELECT id, title, abstract, publication_date, doi, publication_title FROM paper WHERE doi=?",
-        (doi,),
-    )
+    c.execute(_SQL_GET_PAPER_BY_DOI, (doi,))
     paper_row = c.fetchone()
     if not paper_row:
-        conn.close()
         return None
-    c.execute("SELECT author_id FROM paper_author WHERE paper_id=?", (paper_row[0],))
-    author_ids = [r[0] for r in c.fetchall()]
-    authors = [
-        a
-        for a in (get_author_by_id(aid, db_path=db_path) for aid in author_ids)
-        if a is not None
-    ]
-    conn.close()
-    pm = PaperMetaData(
-        paper_row[0],
-        paper_row[1],
-        paper_row[2],
-        authors,
-        paper_row[4],
-        paper_row[5],
-    )
-    if paper_row[3]:
-        pm.publication_date = datetime.fromisoformat(paper_row[3])
-
-    return pm
+    return _row_to_paper(paper_row, _authors_for_paper(c, paper_row[0]))
 
 
 def get_paper_by_id(
-    paper_id: str, db_path: typing.Optional[str] = None
+    paper_id: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> PaperMetaData | None:
     """
     Retrieve a paper by its ID.
     Args:
         paper_id (str): The ID of the paper.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         PaperMetaData or None: The paper object if found, else None.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        'SELECT id, title, abstract, publication_date, doi, publication_title, "check" FROM paper WHERE id=?',
-        (paper_id,),
-    )
+    c.execute(_SQL_GET_PAPER_BY_ID, (paper_id,))
     paper_row = c.fetchone()
     if not paper_row:
-        conn.close()
         return None
-    c.execute("SELECT author_id FROM paper_author WHERE paper_id=?", (paper_row[0],))
-    author_ids = [r[0] for r in c.fetchall()]
-    authors = [
-        a
-        for a in (get_author_by_id(aid, db_path=db_path) for aid in author_ids)
-        if a is not None
-    ]
-    conn.close()
-    pm = PaperMetaData(
-        paper_row[0],
-        paper_row[1],
-        paper_row[2],
-        authors,
-        paper_row[4],
-        paper_row[5],
-    )
-    if paper_row[3]:
-        pm.publication_date = datetime.fromisoformat(paper_row[3])
-    try:
-        pm.check = int(paper_row[6]) if paper_row[6] is not None else 0
-    except Exception:
-        pass
-
-    return pm
+    return _row_to_paper(paper_row, _authors_for_paper(c, paper_row[0]))
 
 
 def get_paper_by_title(
-    title: str, db_path: typing.Optional[str] = None
+    title: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> list[PaperMetaData]:
     """
     Retrieve papers whose titles match the given string.
     Args:
         title (str): The title or partial title to search for.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[PaperMetaData]: List of matching papers.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        "SELECT id, title, abstract, publication_date, doi, publication_title FROM paper WHERE title LIKE ?",
-        (f"%{title}%",),
-    )
-    papers = []
-    for paper_row in c.fetchall():
-        c2 = get_conn(db_path)
-        c2_cur = c2.cursor()
-        c2_cur.execute(
-            "SELECT author_id FROM paper_author WHERE paper_id=?", (paper_row[0],)
-        )
-        author_ids = [r[0] for r in c2_cur.fetchall()]
-        authors = [
-            a
-            for a in (get_author_by_id(aid, db_path=db_path) for aid in author_ids)
-            if a is not None
-        ]
-        c2.close()
-        pm = PaperMetaData(
-            paper_row[0],
-            paper_row[1],
-            paper_row[2],
-            authors,
-            paper_row[4],
-            paper_row[5],
-        )
-        if paper_row[3]:
-            pm.publication_date = datetime.fromisoformat(paper_row[3])
-        papers.append(pm)
-
-    conn.close()
-    return papers
+    _search_like(c, _SQL_GET_PAPERS_BY_TITLE_FTS, _SQL_GET_PAPERS_BY_TITLE, title)
+    paper_rows = c.fetchall()
+    authors = _authors_by_paper(c, [r[0] for r in paper_rows])
+    return [_row_to_paper(paper_row, authors[paper_row[0]]) for paper_row in paper_rows]
 
 
 def get_papers_by_author_id(
-    author_id: str, db_path: typing.Optional[str] = None
+    author_id: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> list[PaperMetaData]:
     """
     Retrieve all papers written by the author with the given ID.
     Args:
         author_id (str): The IEEE ID of the author.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[PaperMetaData]: List of papers authored by the given author.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        "SELECT paper_id FROM paper_author WHERE author_id=?",
-        (author_id,),
-    )
-    paper_ids = [r[0] for r in c.fetchall()]
-    papers = [get_paper_by_id(pid, db_path=db_path) for pid in paper_ids]
-    conn.close()
-    return [p for p in papers if p is not None]
+    c.execute(_SQL_GET_PAPER_IDS_BY_AUTHOR, (author_id,))
+    return _papers_by_ids(c, [r[0] for r in c.fetchall()])
 
 
 def get_papers_by_author_name(
-    name: str, db_path: typing.Optional[str] = None
+    name: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> list[PaperMetaData]:
     """
     Retrieve all papers written by authors whose names match the given string.
     Args:
         name (str): The name or partial name to search for.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[PaperMetaData]: List of papers authored by matching authors.
     """
-    authors = get_author_by_name(name, db_path=db_path)
-    papers = []
-    for author in authors:
-        papers.extend(get_papers_by_author_id(author.author_id, db_path=db_path))
-    return papers
+    c = (conn or get_conn(db_path)).cursor()
+    # one row per (matching author, paper), in the order the per-author lookups used
+    _search_like(
+        c,
+        _SQL_GET_PAPER_IDS_BY_AUTHOR_NAME_FTS,
+        _SQL_GET_PAPER_IDS_BY_AUTHOR_NAME,
+        name,
+    )
+    return _papers_by_ids(c, [r[0] for r in c.fetchall()])
 
 
 def get_authors_by_paper_id(
-    paper_id: str, db_path: typing.Optional[str] = None
+    paper_id: str,
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ) -> list[IEEEAuthor]:
     """
     Retrieve all authors of a paper by the paper's ID.
     Args:
         paper_id (str): The ID of the paper.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[IEEEAuthor]: List of authors for the given paper.
     """
-    conn = get_conn(db_path)
-    c = conn.cursor()
-    c.execute("SELECT author_id FROM paper_author WHERE paper_id=?", (paper_id,))
-    author_ids = [r[0] for r in c.fetchall()]
-    conn.close()
-    authors = []
-    for aid in author_ids:
-        author = get_author_by_id(aid, db_path=db_path)
-        if author is not None:
-            authors.append(author)
-    return authors
+    conn = conn or get_conn(db_path)
+    return _authors_for_paper(conn.cursor(), paper_id)
+
+
+def _write_json_list(f, key: str, records: typing.Iterable[dict]):
+    """Write '"key": [records]' one record at a time, indented as a top-level member."""
+    f.write(f"  {json.dumps(key)}: [")
+    empty = True
+    for record in records:
+        f.write("\n    " if empty else ",\n    ")
+        f.write(_dumps_indented(record).replace("\n", "\n    "))
+        empty = False
+    f.write("]" if empty else "\n  ]")
+
+
+def _iter_export_authors(c: sqlite3.Cursor, lookup: sqlite3.Cursor):
+    c.arraysize = _FETCH_BATCH_SIZE
+    while rows := c.fetchmany():
+        affs, pubs = _load_author_lists(lookup, [r[0] for r in rows])
+        for row in rows:
+            yield {
+                "author_id": row[0],
+                "name": row[1],
+                "affiliation": affs.get(row[0], []),
+                "publication_ids": pubs.get(row[0], []),
+                "check": int(row[2]) if row[2] is not None else 0,
+            }
+
+
+def _iter_export_papers(c: sqlite3.Cursor):
+    # rows come one per (paper, author), grouped by paper
+    for _, group in itertools.groupby(_iter_rows(c), key=lambda r: r[0]):
+        group = list(group)
+        paper_row = group[0]
+        yield {
+            "id": paper_row[0],
+            "title": paper_row[1],
+            "abstract": paper_row[2],
+            "publication_date": paper_row[3],
+            "doi": paper_row[4],
+            "publication_title": paper_row[5],
+            "check": int(paper_row[6]) if paper_row[6] is not None else 0,
+            "authors": [r[7] for r in group if r[7] is not None],
+        }
 
 
 def export_db(
     json_path: str,
     db_path: typing.Optional[str] = None,
     logger: typing.Optional[logging.Logger] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
 ):
     """
     Export all authors and papers in the database to a JSON file.
     Args:
         json_path (str): The path to the output JSON file.
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     """
     logger = logger or logging.getLogger(__name__)
     logger.info(f"Exporting DB to {json_path} (db_path={db_path or DB_PATH})")
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    # Export authors
-    c.execute(
-        'SELECT author_id, name, affiliation, publication_ids, "check" FROM author'
-    )
-    authors = [
-        {
-            "author_id": row[0],
-            "name": row[1],
-            "affiliation": json.loads(row[2]) if row[2] else [],
-            "publication_ids": json.loads(row[3]) if row[3] else [],
-            "check": int(row[4]) if row[4] is not None else 0,
-        }
-        for row in c.fetchall()
-    ]
-    # Export papers
-    c.execute(
-        'SELECT id, title, abstract, publication_date, doi, publication_title, "check" FROM paper'
-    )
-    papers = []
-    for paper_row in c.fetchall():
-        c.execute(
-            "SELECT author_id FROM paper_author WHERE paper_id=?", (paper_row[0],)
-        )
-        author_ids = [r[0] for r in c.fetchall()]
-        papers.append(
-            {
-                "id": paper_row[0],
-                "title": paper_row[1],
-                "abstract": paper_row[2],
-                "publication_date": paper_row[3],
-                "doi": paper_row[4],
-                "publication_title": paper_row[5],
-                "check": int(paper_row[6]) if paper_row[6] is not None else 0,
-                "authors": author_ids,
-            }
-        )
-    conn.close()
+    lookup = conn.cursor()
+    # stream records out in batches; the layout matches json.dump(..., indent=2)
     with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(
-            {"authors": authors, "papers": papers}, f, ensure_ascii=False, indent=2
-        )
+        f.write("{\n")
+        c.execute(_SQL_GET_ALL_AUTHORS)
+        _write_json_list(f, "authors", _iter_export_authors(c, lookup))
+        f.write(",\n")
+        c.execute(_SQL_EXPORT_PAPERS)
+        _write_json_list(f, "papers", _iter_export_papers(c))
+        f.write("\n}")
     logger.info(f"Exported DB to {json_path}")
 
 
-def get_all_authors(db_path: typing.Optional[str] = None) -> list[IEEEAuthor]:
+def get_all_authors(
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> list[IEEEAuthor]:
     """
     Retrieve all authors from the database.
     Args:
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[IEEEAuthor]: List of all authors.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        'SELECT author_id, name, affiliation, publication_ids, "check" FROM author'
-    )
-    rows = c.fetchall()
-    conn.close()
-    authors = []
-    for r in rows:
-        aff = json.loads(r[2]) if r[2] else []
-        pub_ids = json.loads(r[3]) if r[3] else []
-        author = IEEEAuthor(r[0], r[1], aff)
-        try:
-            author.publication_ids = pub_ids
-        except Exception:
-            pass
-        try:
-            author.check = int(r[4]) if r[4] is not None else 0
-        except Exception:
-            pass
-        authors.append(author)
-    return authors
+    lists = _load_author_lists(c)
+    c.execute(_SQL_GET_ALL_AUTHORS)
+    return [_row_to_author(r, lists) for r in _iter_rows(c)]
 
 
-def get_all_papers(db_path: typing.Optional[str] = None) -> list[PaperMetaData]:
+def get_all_papers(
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> list[PaperMetaData]:
     """
     Retrieve all papers from the database.
     Args:
         db_path (str): Optional database path.
+        conn (sqlite3.Connection): Optional connection to reuse for the query.
     Returns:
         list[PaperMetaData]: List of all papers.
     """
-    conn = get_conn(db_path)
+    conn = conn or get_conn(db_path)
     c = conn.cursor()
-    c.execute(
-        'SELECT id, title, abstract, publication_date, doi, publication_title, "check" FROM paper'
-    )
-    papers = []
-    for paper_row in c.fetchall():
-        c.execute(
-            "SELECT author_id FROM paper_author WHERE paper_id=?", (paper_row[0],)
-        )
-        author_ids = [r[0] for r in c.fetchall()]
-        authors = [
-            a
-            for a in (get_author_by_id(aid, db_path=db_path) for aid in author_ids)
-            if a is not None
-        ]
-        pm = PaperMetaData(
-            paper_row[0],
-            paper_row[1],
-            paper_row[2],
-            authors,
-            paper_row[4],
-            paper_row[5],
-        )
-        if paper_row[3]:
-            pm.publication_date = datetime.fromisoformat(paper_row[3])
-        try:
-            pm.check = int(paper_row[6]) if paper_row[6] is not None else 0
-        except Exception:
-            pass
-        papers.append(pm)
-    conn.close()
-    return papers
+    # group every paper's authors in one pass instead of a query per paper
+    lists = _load_author_lists(c)
+    c.execute(_SQL_GET_ALL_PAPER_AUTHORS)
+    authors_by_paper = defaultdict(list)
+    for r in _iter_rows(c):
+        authors_by_paper[r[0]].append(_row_to_author(r[1:], lists))
+    c.execute(_SQL_GET_ALL_PAPERS)
+    return [
+        _row_to_paper(paper_row, authors_by_paper.get(paper_row[0], []))
+        for paper_row in _iter_rows(c)
+    ]
 
 
-def get_unchecked_authors(db_path: typing.Optional[str] = None) -> list[str]:
-    conn = get_conn(db_path)
-    c = conn.cursor()
-    c.execute('SELECT author_id FROM author WHERE "check" IS NULL OR "check" != 1')
-    rows = [r[0] for r in c.fetchall()]
-    conn.close()
-    return rows
+def _stream_ids(
+    db_path: typing.Optional[str],
+    sql: str,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> typing.Iterator[str]:
+    """Yield the first column of sql row by row instead of materializing a list."""
+    c = (conn or get_conn(db_path)).cursor()
+    try:
+        for r in c.execute(sql):
+            yield r[0]
+    finally:
+        c.close()
 
 
-def get_unchecked_papers(db_path: typing.Optional[str] = None) -> list[str]:
-    conn = get_conn(db_path)
-    c = conn.cursor()
-    c.execute('SELECT id FROM paper WHERE "check" IS NULL OR "check" != 1')
-    rows = [r[0] for r in c.fetchall()]
-    conn.close()
-    return rows
+def iter_unchecked_authors(
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> typing.Iterator[str]:
+    """Yield ids of authors whose check flag is unset, without building a list."""
+    return _stream_ids(db_path, _SQL_GET_UNCHECKED_AUTHORS, conn)
+
+
+def iter_unchecked_papers(
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> typing.Iterator[str]:
+    """Yield ids of papers whose check flag is unset, without building a list."""
+    return _stream_ids(db_path, _SQL_GET_UNCHECKED_PAPERS, conn)
+
+
+def get_unchecked_authors(
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> list[str]:
+    """Return ids of authors whose check flag is unset."""
+    return list(iter_unchecked_authors(db_path, conn=conn))
+
+
+def get_unchecked_papers(
+    db_path: typing.Optional[str] = None,
+    *,
+    conn: typing.Optional[sqlite3.Connection] = None,
+) -> list[str]:
+    """Return ids of papers whose check flag is unset."""
+    return list(iter_unchecked_papers(db_path, conn=conn))
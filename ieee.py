@@ -1,258 +1,467 @@
+import atexit
+import contextlib
+import importlib.util
+import json
+import re
+import urllib.request
 from datetime import datetime
-from playwright.sync_api import Browser, Page, ElementHandle
+from playwright.sync_api import Browser, BrowserContext, Page
 import utils as utils
 import T
+from cache import Cacher
 import typing
 import logging
 
+try:
+    import httpx
+except ImportError:  # httpx is optional, fall back to urllib
+    httpx = None
 
-def goto_with_retry(page: Page, url: str, max_retries=3):
-    def _goto():
-        return page.goto(url, wait_until="load")
 
-    return utils.retry_with_exponential_backoff(_goto, max_retries=max_retries)
+# how long to wait for the element that shows a page has rendered
+_RENDER_TIMEOUT_MS = 15000
+
+
+# document pages embed their metadata as "xplGlobal.document.metadata={...};"
+_METADATA_MARKER = re.compile(r"xplGlobal\.document\.metadata\s*=\s*")
+_json_decoder = json.JSONDecoder()
+_HTTP_TIMEOUT = 30  # seconds
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
+)
+
+
+_HTTP_MAX_CONNECTIONS = 20
+
+# shared httpx client, see _get_http_client()
+_http_client = None
+
+
+def _get_http_client():
+    """
+    Return the process-wide httpx.Client, created on first use, so requests
+    reuse pooled TCP/TLS connections. HTTP/2 is enabled when h2 is installed.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            http2=importlib.util.find_spec("h2") is not None,
+            headers={"User-Agent": _USER_AGENT},
+            timeout=_HTTP_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=_HTTP_MAX_CONNECTIONS),
+        )
+        atexit.register(close_http_client)
+    return _http_client
+
+
+def close_http_client():
+    """Close the shared httpx client, if one was created."""
+    global _http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
 
 
-def get_next_sibling_element(el: ElementHandle) -> typing.Optional[ElementHandle]:
+def fetch_html(url: str) -> str:
+    """GET a page's HTML without a browser (httpx if installed, else urllib)."""
+    if httpx is not None:
+        response = _get_http_client().get(url)
+        response.raise_for_status()
+        return response.text
+    request = urllib.request.Request(url, headers={"User-Agent": _USER_AGENT})
+    with urllib.request.urlopen(request, timeout=_HTTP_TIMEOUT) as response:
+        return response.read().decode("utf-8", errors="replace")
+
+
+def parse_document_metadata(html: str) -> typing.Optional[dict]:
     """
-    Return the next sibling element of the given ElementHandle, or None if not present.
-    Usage:
-        next_el = get_next_sibling_element(some_el)
-        if next_el:
-            text = next_el.inner_text()
+    Extract the xplGlobal.document.metadata object embedded in a document page.
+    Returns:
+        The metadata dict, or None if the page doesn't carry it.
     """
-    if el is None:
+    match = _METADATA_MARKER.search(html)
+    if match is None:
         return None
     try:
-        js_handle = el.evaluate_handle("e => e.nextElementSibling")
-        if js_handle:
-            next_el = js_handle.as_element()
-            return next_el
-    except Exception:
+        metadata, _ = _json_decoder.raw_decode(html, match.end())
+    except ValueError:
         return None
-    return None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def paper_from_metadata(
+    publication_id: str, metadata: dict, logger: logging.Logger
+) -> T.PaperMetaData:
+    """Build a PaperMetaData from a document page's embedded metadata."""
+    publication_info = T.PaperMetaData(
+        id=publication_id,
+        title=metadata.get("title") or "",
+        abstract=metadata.get("abstract") or "",
+        doi=metadata.get("doi") or "",
+        publication_title=metadata.get("publicationTitle") or "",
+    )
+    date_str = metadata.get("publicationDate") or metadata.get("onlineDate")
+    if date_str:
+        date = utils.parse_time_with_backoff(date_str)
+        if not date:
+            logger.warning(f"Failed to parse publication date: {date_str}, using now")
+        publication_info.publication_date = date or datetime.now()
+    for author in metadata.get("authors") or []:
+        # a single affiliation may come as a plain string rather than a list
+        aff = author.get("affiliation") or []
+        publication_info.authors.append(
+            T.IEEEAuthor(
+                name=author.get("name") or "",
+                affiliation=[aff] if isinstance(aff, str) else list(aff),
+                author_id=str(author.get("id") or ""),
+            )
+        )
+    logger.info(f"Found {len(publication_info.authors)} authors.")
+    publication_info.check = utils._compute_paper_check(publication_info)
+    return publication_info
 
 
-def _is_default(val):
-    return val is None or val == "" or val == [] or val == {}
+def goto_with_retry(page: Page, url: str, max_retries=3):
+    # the DOM is enough, waiting for "load" also waits on images, ads and trackers
+    def _goto():
+        return page.goto(url, wait_until="domcontentloaded")
 
+    return utils.retry_with_exponential_backoff(_goto, max_retries=max_retries)
 
-def _compute_author_check(author: T.IEEEAuthor) -> int:
-    name = getattr(author, "name", None)
-    aff = getattr(author, "affiliation", None)
-    pubids = getattr(author, "publication_ids", None)
-    return (
-        1
-        if (not _is_default(name) and not _is_default(aff) and not _is_default(pubids))
-        else 0
-    )
 
+# author column layouts: Early Access papers show no author picture, so the
+# name/affiliation column spans the full width; otherwise it sits next to it
+_AUTHOR_COL_EA = "div.col-24-24"
+_AUTHOR_COL_NORMAL = "div.col-14-24"
 
-def _compute_paper_check(paper: T.PaperMetaData) -> int:
-    title = getattr(paper, "title", None)
-    abstract = getattr(paper, "abstract", None)
-    pubdate = getattr(paper, "publication_date", None)
-    doi = getattr(paper, "doi", None)
-    pubtitle = getattr(paper, "publication_title", None)
-    authors = getattr(paper, "authors", None)
-    return (
-        1
-        if (
-            not _is_default(title)
-            and not _is_default(abstract)
-            and not _is_default(pubdate)
-            and not _is_default(doi)
-            and not _is_default(pubtitle)
-            and authors
-            and len(authors) > 0
-        )
-        else 0
-    )
+
+def author_column_candidates(early_access: typing.Optional[bool]) -> list[str]:
+    """
+    Author column selectors to try, the layout expected for the paper first.
+    The other layout stays as a fallback for pages that don't follow it.
+    """
+    if early_access:
+        return [_AUTHOR_COL_EA, _AUTHOR_COL_NORMAL]
+    return [_AUTHOR_COL_NORMAL, _AUTHOR_COL_EA]
+
+
+def select_author_column(
+    early_access: typing.Optional[bool], layouts: dict
+) -> typing.Optional[str]:
+    """
+    Pick the author column layout to read from the layouts found on the page
+    (column selector -> authors, None where the layout didn't match): the
+    first matching one of author_column_candidates(early_access), else None.
+    """
+    for column in author_column_candidates(early_access):
+        if layouts.get(column) is not None:
+            return column
+    return None
+
+
+# publication page selectors
+_SEL_TITLE = "h1.document-title"
+_SEL_ABSTRACT_TOGGLE = "a.document-abstract-toggle-btn"
+_SEL_AUTHORS_TOGGLE = "button#authors"
+_PUBLICATION_SELECTORS = {
+    "title": _SEL_TITLE,
+    "abstract_parent": "div.abstract-text div.u-mb-1",
+    "published_in": "a.stats-document-abstract-publishedIn",
+    "doi": "div.stats-document-abstract-doi a",
+    "publication_date": "div.doc-abstract-pubdate",
+    "author_containers": "div.authors-accordion-container",
+    "author_columns": [_AUTHOR_COL_EA, _AUTHOR_COL_NORMAL],
+}
+
+# author page selectors
+_SEL_AUTHOR_NAME = ".u-pr-02"
+_SEL_AUTHOR_AFFILIATION = "div.current-affiliation div"
+_SEL_YEAR_APPLY = "#Year-apply-btn"
+_SEL_RESULT_ITEMS = "div.List-results-items"
+_SEL_NEXT_PAGE = "li.next-btn button"
+
+# Reads every field fetch_info needs in one evaluate() call instead of a
+# protocol round-trip per query_selector/inner_text; takes
+# _PUBLICATION_SELECTORS. Absent elements come back as null. "author_layouts"
+# holds the authors as read through every column layout, null where it didn't
+# match; select_author_column picks the one to use.
+_JS_SCRAPE_PUBLICATION = """
+(sel) => {
+    const text = (el) => (el ? el.innerText : null);
+    const abstractParent = document.querySelector(sel.abstract_parent);
+    const publishedIn = document.querySelector(sel.published_in);
+    // the element after the publication title marks Early Access papers
+    const sibling = publishedIn ? publishedIn.nextElementSibling : null;
+    const containers = [...document.querySelectorAll(sel.author_containers)];
+
+    const readAuthors = (colSelector) => containers.map((container) => {
+        const col = container.querySelector(colSelector);
+        const link = col ? col.querySelector("a") : null;
+        // affiliations are the divs inside every block after the name block
+        const affiliation = col
+            ? [...col.querySelectorAll(":scope > div")]
+                  .slice(1)
+                  .flatMap((div) => [...div.querySelectorAll("div")].map(text))
+            : [];
+        return {
+            name: link ? link.innerText : "",
+            href: link ? link.getAttribute("href") : null,
+            affiliation,
+        };
+    });
+    // a layout matches when the first author's column holds a link
+    const authorLayouts = {};
+    for (const col of sel.author_columns) {
+        const matched = containers.length && containers[0].querySelector(col + " a");
+        authorLayouts[col] = matched ? readAuthors(col) : null;
+    }
+
+    return {
+        title: text(document.querySelector(sel.title)),
+        abstract: text(abstractParent ? abstractParent.querySelector("div") : null),
+        publication_title: text(publishedIn),
+        early_access: sibling ? sibling.innerText.includes("Early") : null,
+        doi: text(document.querySelector(sel.doi)),
+        publication_date: text(document.querySelector(sel.publication_date)),
+        author_count: containers.length,
+        author_layouts: authorLayouts,
+    };
+}
+"""
 
 
 class PublicationPage:
-    def __init__(self, browser: Browser, publication_id: str, logger: logging.Logger):
+    def __init__(
+        self,
+        browser: Browser | BrowserContext,
+        publication_id: str,
+        logger: logging.Logger,
+        pool: typing.Optional[utils.PagePool] = None,
+        cacher: typing.Optional[Cacher] = None,
+        cache_ttl: typing.Optional[int] = None,
+    ):
         self.browser = browser
         self.publication_id = publication_id
         self.pub_url = f"https://ieeexplore.ieee.org/document/{publication_id}"
         self.logger = logger
-
-    def fetch_info(self) -> typing.Optional[T.PaperMetaData]:
-        ea = False
+        self.pool = pool
+        # where fetch_info keeps its results, see utils.persistent_memoize
+        self.cacher = cacher
+        self.cache_ttl = cache_ttl
+
+    @utils.persistent_memoize("pub", "publication_id")
+    def fetch_info(
+        self, page: typing.Optional[Page] = None
+    ) -> typing.Optional[T.PaperMetaData]:
+        """
+        Fetch the publication's metadata, served from the page's cacher, if
+        any, while the cached entry is younger than cache_ttl.
+        Args:
+            page: Optional open page to navigate instead of opening a new one;
+                without it a page is borrowed from the pool, if any.
+        Returns:
+            The publication info, or None if fetching failed.
+        """
         try:
+            publication_info = self._fetch_from_metadata()
+            if publication_info is not None:
+                return publication_info
             self.logger.info(f"Opening publication page: {self.pub_url}")
-            with self.browser.new_page() as page:
-                goto_with_retry(page, self.pub_url)
-                self.logger.debug("Page loaded, waiting randomly.")
-                utils.random_wait(page, min_seconds=2, max_seconds=4)
-                assert utils.has_access(page), "Access to the page is not available."
-                self.logger.info("Access confirmed.")
-
-                publication_info = T.PaperMetaData(
-                    id=self.publication_id,
-                )
-                el_title = page.query_selector("h1.document-title")
-                if el_title:
-                    publication_info.title = el_title.inner_text()
-                    self.logger.debug(f"Title extracted: {publication_info.title}")
-
-                btn_expand_abstract = page.query_selector(
-                    "a.document-abstract-toggle-btn"
-                )
-                if btn_expand_abstract:
-                    btn_expand_abstract.click()
-                    self.logger.debug("Clicked abstract expand button.")
-                el_ab_parent = page.query_selector("div.abstract-text div.u-mb-1")
-                if el_ab_parent:
-                    divs = el_ab_parent.query_selector_all("div")
-                    if divs:
-                        publication_info.abstract = divs[0].inner_text()
-                        self.logger.debug(
-                            f"Abstract extracted: {publication_info.abstract}"
-                        )
-
-                el_pub_title = page.query_selector(
-                    "a.stats-document-abstract-publishedIn"
-                )
-                if el_pub_title:
-                    publication_info.publication_title = el_pub_title.inner_text()
-                    self.logger.debug(
-                        f"Publication title: {publication_info.publication_title}"
-                    )
-                    # check if Early Access
-                    el_ea = get_next_sibling_element(el_pub_title)
-                    if el_ea:
-                        ea = "Early" in el_ea.inner_text()
-                        if ea:
-                            self.logger.debug("Publication is Early Access.")
-                    else:
-                        self.logger.debug("Publication is not Early Access.")
-
-                el_doi_link = page.query_selector("div.stats-document-abstract-doi a")
-                if el_doi_link:
-                    publication_info.doi = el_doi_link.inner_text()
-                    self.logger.debug(f"DOI: {publication_info.doi}")
-
-                el_pub_date = page.query_selector("div.doc-abstract-pubdate")
-                if el_pub_date:
-                    date_str = (
-                        utils.remove_none(el_pub_date.inner_text(), "")
-                        .split(":")[-1]
-                        .strip()
-                    )
-                    date = utils.parse_time_with_backoff(date_str)
-                    if not date:
-                        self.logger.warning(
-                            f"Failed to parse publication date: {date_str}, using now"
-                        )
-                    publication_info.publication_date = date or datetime.now()
-                    self.logger.debug(
-                        f"Publication date: {publication_info.publication_date}"
-                    )
-
-                btn_expand_author = page.query_selector("button#authors")
-                if btn_expand_author:
-                    btn_expand_author.click()
-                    self.logger.debug("Clicked author expand button.")
-                    utils.random_wait(page)
-                el_authors = page.query_selector_all("div.authors-accordion-container")
-                self.logger.info(f"Found {len(el_authors)} authors.")
-
-                # here is a ugly patch, because there are different layout for maybe
-                # if the paper is in Early Access, if not, author picture will be displayed
-                col_classes = ["col-24-24", "col-14-24"]
-                col_idx = -1
-                # try to find the right pattern
-                for i, col_class in enumerate(col_classes):
-                    el_author_name = el_authors[0].query_selector(f"div.{col_class} a")
-                    if el_author_name:
-                        col_idx = i
-                        self.logger.debug(f"Use pattern {col_class} at index {i}.")
-
-                for el_author in el_authors:
-                    if col_idx == -1:
-                        self.logger.warning(
-                            "No pattern can use to find author information."
-                        )
-                        break
-
-                    author_info = T.IEEEAuthor(name="", affiliation=[], author_id="")
-                    el_author_name, el_col = None, None
-
-                    # we find right pattern, apply them
-                    el_author_name = el_author.query_selector(
-                        f"div.{col_classes[col_idx]} a"
-                    )
-                    el_col = el_author.query_selector(f"div.{col_classes[col_idx]}")
-                    if el_author_name:
-                        author_info.name = el_author_name.inner_text()
-                        author_id = el_author_name.get_attribute("href")
-                        author_info.author_id = utils.remove_none(author_id, "").split(
-                            "/"
-                        )[-1]
-                        self.logger.debug(
-                            f"Author name: {author_info.name}, ID: {author_info.author_id}"
-                        )
-                    if el_col:
-                        first_level_divs = el_col.query_selector_all(":scope > div")
-                        for div in first_level_divs[1:]:
-                            child_divs = div.query_selector_all("div")
-                            author_info.affiliation = [
-                                child.inner_text() for child in child_divs if child
-                            ]
-                        self.logger.debug(
-                            f"Author affiliation: {author_info.affiliation}"
-                        )
-                    publication_info.authors.append(author_info)
-
-            # set paper.check based on collected fields/authors
-            try:
-                publication_info.check = _compute_paper_check(publication_info)
-            except Exception:
-                publication_info.check = 0
-
-            self.logger.info("Publication info extraction completed.")
-            return publication_info
+            if page is not None:
+                return self._scrape(page)
+            if self.pool is not None:
+                with self.pool.borrow() as page:
+                    return self._scrape(page)
+            with utils.open_page(self.browser) as page:
+                return self._scrape(page)
         except Exception as e:
             self.logger.error(f"Error fetching publication info: {e}", exc_info=True)
             return None
 
+    def _fetch_from_metadata(self) -> typing.Optional[T.PaperMetaData]:
+        """
+        Read the publication from the metadata embedded in the page's HTML,
+        without a browser. Returns None when the page has to be rendered.
+        """
+        self.logger.info(f"Fetching publication HTML: {self.pub_url}")
+        try:
+            html = fetch_html(self.pub_url)
+        except Exception as e:
+            self.logger.info(f"Plain HTTP fetch failed ({e}), rendering the page.")
+            return None
+        metadata = parse_document_metadata(html)
+        if metadata is None:
+            self.logger.info("No embedded metadata, rendering the page.")
+            return None
+        publication_info = paper_from_metadata(
+            self.publication_id, metadata, self.logger
+        )
+        self.logger.info("Publication info extraction completed.")
+        return publication_info
+
+    def _scrape(self, page: Page) -> T.PaperMetaData:
+        goto_with_retry(page, self.pub_url)
+        self.logger.debug("Page loaded, waiting for the document to render.")
+        page.wait_for_selector(_SEL_TITLE, state="attached", timeout=_RENDER_TIMEOUT_MS)
+        assert utils.has_access(page), "Access to the page is not available."
+        self.logger.info("Access confirmed.")
+
+        btn_expand_abstract = page.query_selector(_SEL_ABSTRACT_TOGGLE)
+        if btn_expand_abstract:
+            btn_expand_abstract.click()
+            self.logger.debug("Clicked abstract expand button.")
+        btn_expand_author = page.query_selector(_SEL_AUTHORS_TOGGLE)
+        if btn_expand_author:
+            btn_expand_author.click()
+            self.logger.debug("Clicked author expand button.")
+            utils.random_wait(page)
+
+        # everything else is read in the page with a single round-trip
+        data = page.evaluate(_JS_SCRAPE_PUBLICATION, _PUBLICATION_SELECTORS)
+
+        publication_info = T.PaperMetaData(
+            id=self.publication_id,
+        )
+        if data["title"] is not None:
+            publication_info.title = data["title"]
+            self.logger.debug(f"Title extracted: {publication_info.title}")
+        if data["abstract"] is not None:
+            publication_info.abstract = data["abstract"]
+            self.logger.debug(f"Abstract extracted: {publication_info.abstract}")
+
+        if data["publication_title"] is not None:
+            publication_info.publication_title = data["publication_title"]
+            self.logger.debug(
+                f"Publication title: {publication_info.publication_title}"
+            )
+            if data["early_access"]:
+                self.logger.debug("Publication is Early Access.")
+            else:
+                self.logger.debug("Publication is not Early Access.")
+
+        if data["doi"] is not None:
+            publication_info.doi = data["doi"]
+            self.logger.debug(f"DOI: {publication_info.doi}")
+
+        if data["publication_date"] is not None:
+            date_str = data["publication_date"].split(":")[-1].strip()
+            date = utils.parse_time_with_backoff(date_str)
+            if not date:
+                self.logger.warning(
+                    f"Failed to parse publication date: {date_str}, using now"
+                )
+            publication_info.publication_date = date or datetime.now()
+            self.logger.debug(f"Publication date: {publication_info.publication_date}")
+
+        self.logger.info(f"Found {data['author_count']} authors.")
+        layouts = data["author_layouts"]
+        column = select_author_column(data["early_access"], layouts)
+        if data["author_count"] and column is None:
+            self.logger.warning("No pattern can use to find author information.")
+        for author in layouts[column] if column is not None else []:
+            author_info = T.IEEEAuthor(
+                name=author["name"],
+                affiliation=author["affiliation"],
+                author_id=utils.remove_none(author["href"], "").split("/")[-1],
+            )
+            self.logger.debug(
+                f"Author name: {author_info.name}, ID: {author_info.author_id}, "
+                f"affiliation: {author_info.affiliation}"
+            )
+            publication_info.authors.append(author_info)
+
+        # set paper.check based on collected fields/authors
+        try:
+            publication_info.check = utils._compute_paper_check(publication_info)
+        except Exception:
+            publication_info.check = 0
+
+        self.logger.info("Publication info extraction completed.")
+        return publication_info
+
+
+def fetch_many(
+    browser: Browser | BrowserContext,
+    publication_ids: list[str],
+    logger: logging.Logger,
+    pool: typing.Optional[utils.PagePool] = None,
+    cacher: typing.Optional[Cacher] = None,
+    cache_ttl: typing.Optional[int] = None,
+) -> list[typing.Optional[T.PaperMetaData]]:
+    """
+    Fetch several publications, reusing pooled pages instead of opening a page
+    per publication (a one-page pool is used if none is given). A failed id
+    yields None in its slot and does not stop the batch. cacher and cache_ttl
+    are handed to every PublicationPage.
+    Returns:
+        The publication infos, in the order of publication_ids.
+    """
+    with contextlib.ExitStack() as stack:
+        if pool is None:
+            pool = stack.enter_context(utils.PagePool(browser, size=1))
+        return [
+            PublicationPage(
+                browser, publication_id, logger, pool, cacher, cache_ttl
+            ).fetch_info()
+            for publication_id in publication_ids
+        ]
+
 
 class AuthorPage:
-    def __init__(self, browser: Browser, author_id: str, logger: logging.Logger):
+    def __init__(
+        self,
+        browser: Browser | BrowserContext,
+        author_id: str,
+        logger: logging.Logger,
+        pool: typing.Optional[utils.PagePool] = None,
+        cacher: typing.Optional[Cacher] = None,
+        cache_ttl: typing.Optional[int] = None,
+    ):
         self.browser = browser
         self.author_id = author_id
         self.url = f"https://ieeexplore.ieee.org/author/{author_id}?"
         self.logger = logger
+        self.pool = pool
+        # where get_author_info keeps its results, see utils.persistent_memoize
+        self.cacher = cacher
+        self.cache_ttl = cache_ttl
         self._page = None
 
     def _get_or_open_page(self):
         if self._page is None or self._page.is_closed():
             self.logger.info(f"Opening author page: {self.url}")
-            self._page = self.browser.new_page()
+            if self.pool is not None:
+                self._page = self.pool.acquire()
+            else:
+                self._page = utils.open_page(self.browser)
             goto_with_retry(self._page, self.url)
-            self.logger.debug("Page loaded, waiting randomly.")
-            utils.random_wait(self._page)
+            self.logger.debug("Page loaded, waiting for the profile to render.")
+            self._page.wait_for_selector(
+                _SEL_AUTHOR_NAME, state="attached", timeout=_RENDER_TIMEOUT_MS
+            )
             assert utils.has_access(self._page), "Access to the page is not available."
             self.logger.info("Access confirmed.")
         return self._page
 
+    @utils.persistent_memoize("author_info", "author_id")
     def get_author_info(self) -> typing.Optional[T.IEEEAuthor]:
         try:
             page = self._get_or_open_page()
             author_info = T.IEEEAuthor(author_id=self.author_id)
-            el_name = page.query_selector(".u-pr-02")
+            el_name = page.query_selector(_SEL_AUTHOR_NAME)
             if el_name:
                 author_info.name = el_name.inner_text()
                 self.logger.debug(f"Author name: {author_info.name}")
-            el_affiliation_parent = page.query_selector("div.current-affiliation div")
+            el_affiliation_parent = page.query_selector(_SEL_AUTHOR_AFFILIATION)
             if el_affiliation_parent:
                 divs = el_affiliation_parent.query_selector_all("div")
                 author_info.affiliation = [div.inner_text() for div in divs if div]
                 self.logger.debug(f"Author affiliation: {author_info.affiliation}")
 
             try:
-                author_info.check = _compute_author_check(author_info)
+                author_info.check = utils._compute_author_check(author_info)
             except Exception:
                 author_info.check = 0
 
@@ -262,49 +471,61 @@ class AuthorPage:
             self.logger.error(f"Error fetching author info: {e}", exc_info=True)
             return None
 
-    def get_published_work_id_list(
+    def iter_published_work_ids(
         self,
         start_year: typing.Optional[int] = None,
         end_year: typing.Optional[int] = None,
-    ) -> list[str]:
-        ids = []
-        try:
-            page = self._get_or_open_page()
-            self.logger.info(
-                f"Using cached author page for publication list: {self.url}"
+    ) -> typing.Iterator[list[str]]:
+        """
+        Yield the author's published work ids one result page at a time.
+        The click to the next result page is issued before the current ids are
+        yielded, so the browser loads it while the caller handles the batch.
+        """
+        page = self._get_or_open_page()
+        self.logger.info(f"Using cached author page for publication list: {self.url}")
+
+        if start_year is not None and end_year is not None:
+            self.logger.info(f"Filtering publications from {start_year} to {end_year}")
+            page.get_by_role("textbox", name="Enter start year of range").fill(
+                str(start_year)
+            )
+            page.get_by_role("textbox", name="Enter end year of range").fill(
+                str(end_year)
             )
 
-            if start_year is not None and end_year is not None:
-                self.logger.info(
-                    f"Filtering publications from {start_year} to {end_year}"
-                )
-                page.get_by_role("textbox", name="Enter start year of range").fill(
-                    str(start_year)
+            btn = page.query_selector(_SEL_YEAR_APPLY)
+            assert btn is not None, "Year apply button not found."
+            btn.click()
+            self.logger.debug("Clicked year apply button.")
+            utils.random_wait(page, min_seconds=4, max_seconds=10)
+
+        while True:
+            divs = page.query_selector_all(_SEL_RESULT_ITEMS)
+            batch = [utils.remove_none(div.get_attribute("id"), "") for div in divs]
+            next_btn = page.query_selector(_SEL_NEXT_PAGE)
+            has_next = next_btn is not None and next_btn.is_enabled()
+            if has_next:
+                self.logger.debug("Next page button found, clicking to continue.")
+                next_btn.click()
+            else:
+                self.logger.debug(
+                    "No next page button found or button disabled, stop paging."
                 )
-                page.get_by_role("textbox", name="Enter end year of range").fill(
-                    str(end_year)
-                )
-
-                btn = page.query_selector("#Year-apply-btn")
-                assert btn is not None, "Year apply button not found."
-                btn.click()
-                self.logger.debug("Clicked year apply button.")
-                utils.random_wait(page, min_seconds=4, max_seconds=10)
+            yield batch
+            if not has_next:
+                return
+            utils.random_wait(page, min_seconds=2, max_seconds=4)
 
-            while True:
-                divs = page.query_selector_all("div.List-results-items")
-                ids += [utils.remove_none(div.get_attribute("id"), "") for div in divs]
+    def get_published_work_id_list(
+        self,
+        start_year: typing.Optional[int] = None,
+        end_year: typing.Optional[int] = None,
+    ) -> list[str]:
+        ids = []
+        try:
+            for batch in self.iter_published_work_ids(start_year, end_year):
+                ids += batch
                 self.logger.info(f"Collected {len(ids)} published works so far.")
-                next_btn = page.query_selector("li.next-btn button")
-                if next_btn and next_btn.is_enabled():
-                    self.logger.debug("Next page button found, clicking to continue.")
-                    next_btn.click()
-                    utils.random_wait(page, min_seconds=2, max_seconds=4)
-                else:
-                    self.logger.debug(
-                        "No next page button found or button disabled, stop paging."
-                    )
-                    break
             self.logger.info(f"Found {len(ids)} published works in total.")
             return ids
 
@@ -320,7 +541,10 @@ class AuthorPage:
 
     def close(self):
         if self._page and not self._page.is_closed():
-            self._page.close()
+            if self.pool is not None:
+                self.pool.release(self._page)
+            else:
+                self._page.close()
             self._page = None
 
 
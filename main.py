@@ -1,28 +1,32 @@
 import sys
 import argparse
+import importlib
 import logging
-from cli.cli_ieee import IEEEPlugin
-from cli.cli_cache import CachePlugin
-from cli.cli_filter import FilterPlugin
-from cli.cli_json import JSONPlugin
 
-# Manually register plugins here
+# Manually register plugins here, as "module:class"; a plugin's module is only
+# imported when its command runs (or when help lists every command)
 plugins = {
-    # "hello": HelloPlugin,
-    # "db": DBPlugin,
-    "json": JSONPlugin,
-    "filter": FilterPlugin,
-    "ieee": IEEEPlugin,
-    "cache": CachePlugin,
+    # "hello": "cli.cli_hello:HelloPlugin",
+    # "db": "cli.cli_db:DBPlugin",
+    "json": "cli.cli_json:JSONPlugin",
+    "filter": "cli.cli_filter:FilterPlugin",
+    "ieee": "cli.cli_ieee:IEEEPlugin",
+    "cache": "cli.cli_cache:CachePlugin",
 }
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("I3E")
 
 
+def load_plugin(name: str):
+    module, cls_name = plugins[name].split(":")
+    return getattr(importlib.import_module(module), cls_name)
+
+
 def print_help():
     print("Available CLI commands:")
-    for name, cls in plugins.items():
+    for name in plugins:
+        cls = load_plugin(name)
         print(f"  {name:15} {getattr(cls, 'description', '')}")
 
 
@@ -37,24 +41,29 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command", help="sub-command help")
 
-    # Register plugin subcommands
-    for name, cls in plugins.items():
-        subparser = subparsers.add_parser(
-            name,
-            help=f"{getattr(cls, 'description', '')}, use {name} --help for more info",
-        )
-        if hasattr(cls, "add_arguments"):
-            cls.add_arguments(subparser)
-
     if len(sys.argv) < 2:
         print_help()
         return
 
+    # Register plugin subcommands, importing only the requested one; without
+    # a known command (e.g. plain --help) every plugin is loaded for the listing
+    requested = next((a for a in sys.argv[1:] if a in plugins), None)
+    for name in plugins:
+        if requested is not None and name != requested:
+            subparsers.add_parser(name)
+            continue
+        cls = load_plugin(name)
+        subparsers.add_parser(
+            name,
+            help=f"{getattr(cls, 'description', '')}, use {name} --help for more info",
+            parents=[cls.get_parser()],
+        )
+
     args = parser.parse_args()
     logger.setLevel(args.log_level)
     cmd = args.command
     if cmd in plugins:
-        plugin = plugins[cmd](logger=logger)
+        plugin = load_plugin(cmd)(logger=logger)
         plugin.run(args)
     else:
         print(f"Unknown command: {cmd}")
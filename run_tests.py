@@ -2,19 +2,31 @@
 """Test runner script for objfilter and related modules using pytest"""
 
 import sys
+import contextlib
 import subprocess
 from pathlib import Path
 
 
+def run_pytest(args, cwd):
+    """
+    Run pytest with args from cwd, in this process when pytest is importable
+    (saves a second interpreter start and plugin discovery), else as a subprocess.
+    """
+    try:
+        import pytest
+    except ImportError:
+        result = subprocess.run([sys.executable, "-m", "pytest", *args], cwd=cwd)
+        return result.returncode
+    with contextlib.chdir(cwd):
+        return int(pytest.main(args))
+
+
 def run_tests():
     """Run all tests using pytest"""
     project_root = Path(__file__).parent
 
-    # Basic pytest command
+    # Basic pytest arguments
     cmd = [
-        sys.executable,
-        "-m",
-        "pytest",
         str(project_root / "tests"),
         "-v",
         "--tb=short",
@@ -40,8 +52,7 @@ def run_tests():
 
     # Run pytest
     try:
-        result = subprocess.run(cmd, cwd=project_root)
-        return result.returncode
+        return run_pytest(cmd, project_root)
     except Exception as e:
         print(f"Error running tests: {e}")
         return 1
@@ -54,7 +65,7 @@ def run_specific_tests():
     if len(sys.argv) > 1:
         test_type = sys.argv[1]
 
-        cmd = [sys.executable, "-m", "pytest", str(project_root / "tests"), "-v"]
+        cmd = [str(project_root / "tests"), "-v"]
 
         if test_type == "unit":
             cmd.extend(["-m", "unit"])
@@ -70,8 +81,7 @@ def run_specific_tests():
             return 1
 
         try:
-            result = subprocess.run(cmd, cwd=project_root)
-            return result.returncode
+            return run_pytest(cmd, project_root)
         except Exception as e:
             print(f"Error running tests: {e}")
             return 1
@@ -0,0 +1,85 @@
+# type: ignore
+import pytest
+import json
+import sys
+import os
+from argparse import Namespace
+
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cli.cli_json import JSONPlugin, _compress_bytes
+
+
+def compress(tmp_path, raw, validate=False):
+    """Run the compress command on raw input bytes and return the output bytes"""
+    src = tmp_path / "in.json"
+    dst = tmp_path / "out.json"
+    src.write_bytes(raw)
+    args = Namespace(
+        json_command="compress", input=str(src), output=str(dst), validate=validate
+    )
+    JSONPlugin().run(args)
+    return dst.read_bytes()
+
+
+class TestCompressBytes:
+    """Test whitespace stripping on raw JSON bytes"""
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"a": 'say "hi"', "b": "back\\slash", "c": "\\"},
+            {"text": "  spaced \t out  ", "list": [" ", ""]},
+            {"名前": "Ünïcødé ✓", "emoji": "😀"},
+            [1, 2.5, True, False, None, {"nested": [[], {}]}],
+        ],
+    )
+    def test_matches_minified_dump(self, value):
+        """Test the output equals json.dumps with compact separators"""
+        raw = json.dumps(value, indent=2, ensure_ascii=False).encode("utf-8")
+        expected = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        assert _compress_bytes(raw) == expected.encode("utf-8")
+
+    def test_escaped_quote_keeps_string_open(self):
+        """Test an escaped quote doesn't end the string literal"""
+        raw = b'[ "a\\" b" , "c\\\\" , 1 ]'
+        assert _compress_bytes(raw) == b'["a\\" b","c\\\\",1]'
+
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [
+            (b'{ "a" : "x', b'{"a":"x'),
+            (b'{ "a" : x }', b'{"a":x}'),
+            (b"[ 1 ,, 2 ]", b"[1,,2]"),
+        ],
+    )
+    def test_malformed_bytes_are_kept(self, raw, expected):
+        """Test only whitespace is dropped from invalid input"""
+        assert _compress_bytes(raw) == expected
+
+
+class TestCompressCommand:
+    """Test the json compress command end to end"""
+
+    @pytest.mark.parametrize("validate", [False, True])
+    def test_compress_file(self, tmp_path, validate):
+        """Test both paths write the same minified JSON"""
+        value = {"title": "A \"quoted\" title", "authors": ["Zoë", "  Bob  "]}
+        raw = json.dumps(value, indent=4, ensure_ascii=False).encode("utf-8")
+
+        out = compress(tmp_path, raw, validate=validate)
+        assert json.loads(out) == value
+        assert out == json.dumps(
+            value, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def test_validate_rejects_bad_input(self, tmp_path):
+        """Test --validate raises on invalid JSON and writes nothing"""
+        with pytest.raises(Exception):
+            compress(tmp_path, b'{ "a" : "x', validate=True)
+        assert not (tmp_path / "out.json").exists()
+
+    def test_default_passes_bad_input_through(self, tmp_path):
+        """Test the byte path keeps invalid input instead of corrupting it"""
+        assert compress(tmp_path, b'{ "a" : "x') == b'{"a":"x'
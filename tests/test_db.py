@@ -0,0 +1,398 @@
+# type: ignore
+import pytest
+import json
+import sqlite3
+import sys
+import os
+import types
+from datetime import datetime
+
+# Add the parent directory to the path so we can import our modules
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from T import IEEEAuthor, PaperMetaData
+
+_DEPRECATION_RAISE = (
+    'raise NotImplementedError("SQlite3 based Database backend is deprecated.")'
+)
+
+
+@pytest.fixture(scope="module")
+def db():
+    """db.py loaded without the import-time raise marking it deprecated"""
+    path = os.path.join(ROOT, "db.py")
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    assert _DEPRECATION_RAISE in source
+    module = types.ModuleType("db")
+    module.__file__ = path
+    # "pass" keeps the line numbers of tracebacks in place
+    code = compile(source.replace(_DEPRECATION_RAISE, "pass"), path, "exec")
+    exec(code, module.__dict__)
+    return module
+
+
+@pytest.fixture
+def db_path(db, tmp_path):
+    """An initialized database file, closed again after the test"""
+    path = str(tmp_path / "test.db")
+    db.init_db(db_path=path)
+    yield path
+    db.close_conn()
+
+
+def make_author(author_id="A1", **fields):
+    values = {
+        "name": "Alice Smith",
+        "affiliation": ["MIT", "CSAIL"],
+        "publication_ids": ["P1"],
+    }
+    values.update(fields)
+    return IEEEAuthor(author_id=author_id, **values)
+
+
+def make_paper(paper_id="P1", **fields):
+    values = {
+        "title": "Deep Graph Networks",
+        "abstract": "An abstract",
+        "authors": [make_author()],
+        "publication_date": datetime(2021, 5, 1),
+        "doi": f"10.1000/{paper_id}",
+        "publication_title": "TPAMI",
+    }
+    values.update(fields)
+    return PaperMetaData(id=paper_id, **values)
+
+
+class TestAuthorRoundTrip:
+    """Test saving, merging and reading back authors"""
+
+    def test_save_and_get_by_id(self, db, db_path):
+        """Test an author reads back with its list fields in order"""
+        db.save_or_update_author(make_author(), db_path=db_path)
+        author = db.get_author_by_id("A1", db_path=db_path)
+
+        assert author.name == "Alice Smith"
+        assert author.affiliation == ["MIT", "CSAIL"]
+        assert author.publication_ids == ["P1"]
+        assert author.check == 1
+
+    def test_missing_author(self, db, db_path):
+        """Test an unknown id returns None"""
+        assert db.get_author_by_id("nope", db_path=db_path) is None
+
+    @pytest.mark.parametrize(
+        "strategy, expected", [("AN", "Alice B. Smith"), ("AO", "Alice Smith")]
+    )
+    def test_update_strategy(self, db, db_path, strategy, expected):
+        """Test conflicting names follow the strategy"""
+        db.save_or_update_author(make_author(), db_path=db_path)
+        db.save_or_update_author(
+            make_author(name="Alice B. Smith"), db_path=db_path, strategy=strategy
+        )
+        assert db.get_author_by_id("A1", db_path=db_path).name == expected
+
+    def test_update_keeps_set_fields(self, db, db_path):
+        """Test empty incoming fields don't overwrite stored ones"""
+        db.save_or_update_author(make_author(), db_path=db_path)
+        db.save_or_update_author(
+            make_author(affiliation=[], publication_ids=["P1", "P2"]),
+            db_path=db_path,
+        )
+        author = db.get_author_by_id("A1", db_path=db_path)
+
+        assert author.affiliation == ["MIT", "CSAIL"]
+        assert author.publication_ids == ["P1", "P2"]
+
+    @pytest.mark.parametrize("query", ["Smith", "li", "ALICE"])
+    def test_get_by_name(self, db, db_path, query):
+        """Test substring name search, with and without the trigram index"""
+        db.save_or_update_author(make_author(), db_path=db_path)
+        db.save_or_update_author(make_author("A2", name="Bob"), db_path=db_path)
+
+        assert [a.author_id for a in db.get_author_by_name(query, db_path=db_path)] == [
+            "A1"
+        ]
+
+
+class TestSearchFallback:
+    """Test substring search on databases without the trigram index"""
+
+    def test_scan_without_fts_tables(self, db, db_path):
+        """Test searches fall back to LIKE scans when the index is missing"""
+        db.save_paper(make_paper(), db_path=db_path)
+        conn = db.get_conn(db_path)
+        for fts, _, _ in db._FTS_TABLES:
+            conn.executescript(
+                f"DROP TRIGGER {fts}_ai; DROP TRIGGER {fts}_ad; "
+                f"DROP TRIGGER {fts}_au; DROP TABLE {fts};"
+            )
+
+        papers = db.get_paper_by_title("Graph", db_path=db_path)
+        authors = db.get_author_by_name("Alice", db_path=db_path)
+        assert [p.id for p in papers] == ["P1"]
+        assert [a.author_id for a in authors] == ["A1"]
+
+    def test_other_errors_are_raised(self, db, db_path):
+        """Test errors other than a missing index are not swallowed"""
+        c = db.get_conn(db_path).cursor()
+        with pytest.raises(sqlite3.OperationalError, match="no such column"):
+            db._search_like(
+                c,
+                "SELECT id FROM paper WHERE missing LIKE ?",
+                "SELECT id FROM paper WHERE title LIKE ?",
+                "Graph",
+            )
+
+
+class TestPaperRoundTrip:
+    """Test saving, updating and reading back papers"""
+
+    def test_save_and_get(self, db, db_path):
+        """Test a paper reads back by id and doi with its authors"""
+        db.save_paper(make_paper(), db_path=db_path)
+
+        for paper in (
+            db.get_paper_by_id("P1", db_path=db_path),
+            db.get_paper_by_doi("10.1000/P1", db_path=db_path),
+        ):
+            assert paper.title == "Deep Graph Networks"
+            assert paper.publication_date == datetime(2021, 5, 1)
+            assert [a.author_id for a in paper.authors] == ["A1"]
+            assert paper.authors[0].affiliation == ["MIT", "CSAIL"]
+        assert db.get_paper_by_id("P1", db_path=db_path).check == 1
+
+    def test_search_by_title(self, db, db_path):
+        """Test substring title search"""
+        db.save_paper(make_paper(), db_path=db_path)
+        db.save_paper(make_paper("P2", title="Other"), db_path=db_path)
+
+        assert [p.id for p in db.get_paper_by_title("graph", db_path=db_path)] == [
+            "P1"
+        ]
+        assert [p.id for p in db.get_paper_by_title("Ot", db_path=db_path)] == ["P2"]
+
+    def test_papers_by_author(self, db, db_path):
+        """Test papers are found through their authors"""
+        db.save_paper(make_paper(), db_path=db_path)
+        db.save_paper(
+            make_paper("P2", authors=[make_author("A2", name="Bob")]), db_path=db_path
+        )
+
+        assert [p.id for p in db.get_papers_by_author_id("A2", db_path=db_path)] == [
+            "P2"
+        ]
+        assert [
+            p.id for p in db.get_papers_by_author_name("alice", db_path=db_path)
+        ] == ["P1"]
+        assert [
+            a.author_id for a in db.get_authors_by_paper_id("P2", db_path=db_path)
+        ] == ["A2"]
+
+    def test_update_paper_column(self, db, db_path):
+        """Test update_paper changes just the given column"""
+        db.save_paper(make_paper(), db_path=db_path)
+        db.update_paper("P1", db_path=db_path, title="Renamed")
+        paper = db.get_paper_by_id("P1", db_path=db_path)
+
+        assert paper.title == "Renamed"
+        assert paper.abstract == "An abstract"
+        assert paper.check == 1
+        assert [p.id for p in db.get_paper_by_title("Renamed", db_path=db_path)] == [
+            "P1"
+        ]
+
+    def test_update_keeps_check_without_date(self, db, db_path):
+        """Test editing a column of a row without a date keeps its check flag"""
+        db.save_paper(make_paper(), db_path=db_path)
+        db.get_conn(db_path).execute(
+            'UPDATE paper SET publication_date=NULL, "check"=1 WHERE id=?', ("P1",)
+        )
+        db.update_paper("P1", db_path=db_path, title="Renamed")
+        assert db.get_paper_by_id("P1", db_path=db_path).check == 1
+
+        # the save path agrees on the same row
+        db.save_paper(make_paper(publication_date=None), db_path=db_path)
+        assert db.get_paper_by_id("P1", db_path=db_path).check == 1
+
+    def test_update_unknown_paper_creates_it(self, db, db_path):
+        """Test update_paper on a missing id inserts a minimal paper"""
+        db.update_paper("P9", db_path=db_path, title="New")
+        assert db.get_paper_by_id("P9", db_path=db_path).title == "New"
+
+    def test_unchecked_ids(self, db, db_path):
+        """Test incomplete papers and authors are listed as unchecked"""
+        db.save_paper(make_paper(), db_path=db_path)
+        db.save_paper(
+            make_paper("P2", abstract="", authors=[make_author("A2", affiliation=[])]),
+            db_path=db_path,
+        )
+
+        assert db.get_unchecked_papers(db_path=db_path) == ["P2"]
+        assert db.get_unchecked_authors(db_path=db_path) == ["A2"]
+        assert list(db.iter_unchecked_papers(db_path=db_path)) == ["P2"]
+        assert list(db.iter_unchecked_authors(db_path=db_path)) == ["A2"]
+
+    def test_unchecked_iterator_across_databases(self, db, db_path, tmp_path):
+        """Test an unchecked id iterator survives reading another database"""
+        other = str(tmp_path / "other.db")
+        db.init_db(db_path=other)
+        for pid in ("P1", "P2"):
+            db.save_paper(make_paper(pid, abstract=""), db_path=db_path)
+        db.save_paper(make_paper("P3", abstract=""), db_path=other)
+
+        it = db.iter_unchecked_papers(db_path=db_path)
+        assert next(it) == "P1"
+        assert db.get_unchecked_papers(db_path=other) == ["P3"]
+        assert list(it) == ["P2"]
+
+
+class TestImportExport:
+    """Test bulk import and JSON export"""
+
+    def test_import_into_new_file(self, db, tmp_path):
+        """Test import_bulk writes a searchable database"""
+        path = str(tmp_path / "imported.db")
+        papers = [make_paper(f"P{i}", title=f"Paper number {i}") for i in range(3)]
+        try:
+            db.import_bulk(papers, db_path=path)
+            db.init_db(db_path=path)
+
+            assert [p.id for p in db.get_all_papers(db_path=path)] == [
+                "P0",
+                "P1",
+                "P2",
+            ]
+            assert [a.author_id for a in db.get_all_authors(db_path=path)] == ["A1"]
+            assert [
+                p.id for p in db.get_paper_by_title("number 2", db_path=path)
+            ] == ["P2"]
+        finally:
+            db.close_conn()
+
+    def test_import_merges_into_existing(self, db, db_path):
+        """Test import_bulk merges into a database that has data"""
+        db.save_paper(make_paper(), db_path=db_path)
+        db.import_bulk([make_paper("P2")], db_path=db_path)
+        assert [p.id for p in db.get_all_papers(db_path=db_path)] == ["P1", "P2"]
+
+    def test_export(self, db, db_path, tmp_path):
+        """Test export_db writes every author and paper as JSON"""
+        db.save_paper(make_paper(), db_path=db_path)
+        out = tmp_path / "export.json"
+        db.export_db(str(out), db_path=db_path)
+
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["authors"] == [
+            {
+                "author_id": "A1",
+                "name": "Alice Smith",
+                "affiliation": ["MIT", "CSAIL"],
+                "publication_ids": ["P1"],
+                "check": 1,
+            }
+        ]
+        assert data["papers"] == [
+            {
+                "id": "P1",
+                "title": "Deep Graph Networks",
+                "abstract": "An abstract",
+                "publication_date": "2021-05-01T00:00:00",
+                "doi": "10.1000/P1",
+                "publication_title": "TPAMI",
+                "check": 1,
+                "authors": ["A1"],
+            }
+        ]
+
+
+class TestMigration:
+    """Test upgrading databases written before the author child tables"""
+
+    @pytest.fixture
+    def legacy_path(self, tmp_path):
+        """A database with author lists stored as JSON columns"""
+        path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE author (author_id TEXT PRIMARY KEY, name TEXT, "
+            "affiliation TEXT, publication_ids TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO author VALUES (?, ?, ?, ?)",
+            ("A1", "Alice Smith", '["MIT", "CSAIL"]', '["P1", "P2"]'),
+        )
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_migrates_legacy_row(self, db, legacy_path):
+        """Test a pre-migration author reads back with its lists"""
+        try:
+            db.init_db(db_path=legacy_path)
+            author = db.get_author_by_id("A1", db_path=legacy_path, cache=False)
+
+            assert author.name == "Alice Smith"
+            assert author.affiliation == ["MIT", "CSAIL"]
+            assert author.publication_ids == ["P1", "P2"]
+        finally:
+            db.close_conn()
+
+    def test_migrates_once(self, db, legacy_path):
+        """Test the schema version stops init_db from migrating again"""
+        try:
+            db.init_db(db_path=legacy_path)
+            conn = db.get_conn(legacy_path)
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == 1
+
+            # a later init_db leaves the legacy columns alone
+            conn.execute("UPDATE author SET affiliation='[\"ETH\"]'")
+            db.init_db(db_path=legacy_path)
+            author = db.get_author_by_id("A1", db_path=legacy_path, cache=False)
+            assert author.affiliation == ["MIT", "CSAIL"]
+        finally:
+            db.close_conn()
+
+    def test_new_database_is_current(self, db, db_path, tmp_path):
+        """Test fresh and imported databases start at the current version"""
+        imported = str(tmp_path / "imported.db")
+        try:
+            db.import_bulk([make_paper()], db_path=imported)
+            for path in (db_path, imported):
+                version = db.get_conn(path).execute("PRAGMA user_version")
+                assert version.fetchone()[0] == 1
+        finally:
+            db.close_conn()
+
+
+class TestConnections:
+    """Test the per-thread connection cache"""
+
+    def test_connection_reused_per_path(self, db, db_path):
+        """Test repeated calls for one path share a connection"""
+        assert db.get_conn(db_path) is db.get_conn(db_path)
+
+    def test_other_path_keeps_reader_open(self, db, db_path, tmp_path):
+        """Test using a second database doesn't close a cursor on the first"""
+        other = str(tmp_path / "other.db")
+        db.save_paper(make_paper(), db_path=db_path)
+        db.save_paper(make_paper("P2"), db_path=db_path)
+        cursor = db.get_conn(db_path).execute("SELECT id FROM paper ORDER BY id")
+        assert cursor.fetchone() == ("P1",)
+
+        db.init_db(db_path=other)
+        db.save_paper(make_paper("P3"), db_path=other)
+
+        assert cursor.fetchall() == [("P2",)]
+        assert [p.id for p in db.get_all_papers(db_path=other)] == ["P3"]
+
+    def test_close_one_path(self, db, db_path, tmp_path):
+        """Test close_conn with a path leaves other connections open"""
+        other = str(tmp_path / "other.db")
+        first = db.get_conn(db_path)
+        db.get_conn(other)
+        db.close_conn(other)
+
+        assert db.get_conn(db_path) is first
+        first.execute("SELECT 1")
@@ -0,0 +1,192 @@
+# type: ignore
+import pytest
+import sys
+import os
+
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import logging
+from ieee import (
+    author_column_candidates,
+    select_author_column,
+    paper_from_metadata,
+    PublicationPage,
+    _AUTHOR_COL_EA,
+    _AUTHOR_COL_NORMAL,
+)
+
+
+class TestAuthorColumnCandidates:
+    """Test author column layout selection"""
+
+    def test_early_access_layout_first(self):
+        """Test Early Access papers try the full width column first"""
+        assert author_column_candidates(True) == ["div.col-24-24", "div.col-14-24"]
+
+    def test_regular_layout_first(self):
+        """Test regular papers try the column next to the picture first"""
+        assert author_column_candidates(False) == ["div.col-14-24", "div.col-24-24"]
+
+    @pytest.mark.parametrize("early_access", [True, False, None])
+    def test_both_layouts_tried(self, early_access):
+        """Test the other layout stays as a fallback"""
+        candidates = author_column_candidates(early_access)
+        assert sorted(candidates) == ["div.col-14-24", "div.col-24-24"]
+
+    def test_unknown_is_regular(self):
+        """Test a missing Early Access marker means a regular paper"""
+        assert author_column_candidates(None) == author_column_candidates(False)
+
+
+EA_AUTHORS = [{"name": "Ann", "href": "/author/1", "affiliation": ["MIT"]}]
+REGULAR_AUTHORS = [{"name": "Bob", "href": "/author/2", "affiliation": ["ETH"]}]
+
+
+class TestSelectAuthorColumn:
+    """Test picking the author layout from the ones found on the page"""
+
+    @pytest.mark.parametrize(
+        "early_access, expected",
+        [
+            (True, _AUTHOR_COL_EA),
+            (False, _AUTHOR_COL_NORMAL),
+            (None, _AUTHOR_COL_NORMAL),
+        ],
+    )
+    def test_expected_layout_wins(self, early_access, expected):
+        """Test the layout expected for the paper is used when both match"""
+        layouts = {_AUTHOR_COL_EA: EA_AUTHORS, _AUTHOR_COL_NORMAL: REGULAR_AUTHORS}
+        assert select_author_column(early_access, layouts) == expected
+
+    @pytest.mark.parametrize("early_access", [True, False])
+    def test_falls_back_to_other_layout(self, early_access):
+        """Test a page not following the expected layout still yields authors"""
+        only_ea = {_AUTHOR_COL_EA: EA_AUTHORS, _AUTHOR_COL_NORMAL: None}
+        only_regular = {_AUTHOR_COL_EA: None, _AUTHOR_COL_NORMAL: REGULAR_AUTHORS}
+        assert select_author_column(early_access, only_ea) == _AUTHOR_COL_EA
+        assert select_author_column(early_access, only_regular) == _AUTHOR_COL_NORMAL
+
+    def test_no_layout_matched(self):
+        """Test None when no layout holds the authors"""
+        layouts = {_AUTHOR_COL_EA: None, _AUTHOR_COL_NORMAL: None}
+        assert select_author_column(True, layouts) is None
+        assert select_author_column(False, {}) is None
+
+
+class FakeScrapePage:
+    """Stands in for a rendered publication page returning fixed script data"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def goto(self, url, wait_until=None):
+        pass
+
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        pass
+
+    def query_selector(self, selector):
+        # only the institution name marking access is present
+        return object() if selector == "div.inst-name" else None
+
+    def evaluate(self, script, arg):
+        return self.data
+
+
+def scrape_data(early_access, layouts):
+    return {
+        "title": "A paper",
+        "abstract": "An abstract",
+        "publication_title": "TPAMI",
+        "early_access": early_access,
+        "doi": "10.1000/x",
+        "publication_date": "Date of Publication: 1 May 2021",
+        "author_count": 1,
+        "author_layouts": layouts,
+    }
+
+
+class TestScrapeAuthors:
+    """Test the scraper reads authors through the selected layout"""
+
+    def scrape(self, data, caplog):
+        page = PublicationPage(None, "42", logging.getLogger("test_ieee"))
+        with caplog.at_level(logging.DEBUG, logger="test_ieee"):
+            return page._scrape(FakeScrapePage(data))
+
+    @pytest.mark.parametrize(
+        "early_access, expected", [(True, "1"), (False, "2"), (None, "2")]
+    )
+    def test_authors_from_expected_layout(self, caplog, early_access, expected):
+        """Test Early Access papers read the full width column"""
+        layouts = {_AUTHOR_COL_EA: EA_AUTHORS, _AUTHOR_COL_NORMAL: REGULAR_AUTHORS}
+        paper = self.scrape(scrape_data(early_access, layouts), caplog)
+        assert [a.author_id for a in paper.authors] == [expected]
+
+    def test_no_layout_leaves_authors_empty(self, caplog):
+        """Test a page without a matching layout is reported"""
+        layouts = {_AUTHOR_COL_EA: None, _AUTHOR_COL_NORMAL: None}
+        paper = self.scrape(scrape_data(True, layouts), caplog)
+        assert paper.authors == []
+        assert "No pattern can use to find author information." in caplog.text
+
+    @pytest.mark.parametrize(
+        "early_access, message",
+        [
+            (True, "Publication is Early Access."),
+            (False, "Publication is not Early Access."),
+            (None, "Publication is not Early Access."),
+        ],
+    )
+    def test_early_access_logged(self, caplog, early_access, message):
+        """Test both regular and unmarked papers are logged as not Early Access"""
+        layouts = {_AUTHOR_COL_EA: None, _AUTHOR_COL_NORMAL: REGULAR_AUTHORS}
+        self.scrape(scrape_data(early_access, layouts), caplog)
+        assert message in caplog.messages
+
+
+class TestPaperFromMetadata:
+    """Test building papers from a document page's embedded metadata"""
+
+    METADATA = {
+        "title": "Deep Graph Networks",
+        "abstract": "An abstract",
+        "doi": "10.1000/P1",
+        "publicationTitle": "TPAMI",
+        "publicationDate": "May 2021",
+    }
+
+    @pytest.mark.parametrize(
+        "affiliation, expected",
+        [
+            (["MIT", "CSAIL"], ["MIT", "CSAIL"]),
+            ("MIT", ["MIT"]),
+            (None, []),
+        ],
+    )
+    def test_affiliation_shapes(self, affiliation, expected):
+        """Test a plain string affiliation isn't split into characters"""
+        metadata = dict(
+            self.METADATA,
+            authors=[{"name": "Alice", "affiliation": affiliation, "id": 7}],
+        )
+        paper = paper_from_metadata("P1", metadata, logging.getLogger(__name__))
+        author = paper.authors[0]
+
+        assert author.affiliation == expected
+        assert author.author_id == "7"
+
+    def test_fields(self):
+        """Test the paper fields and check flag"""
+        metadata = dict(
+            self.METADATA,
+            authors=[{"name": "Alice", "affiliation": "MIT", "id": 7}],
+        )
+        paper = paper_from_metadata("P1", metadata, logging.getLogger(__name__))
+
+        assert paper.id == "P1"
+        assert paper.title == "Deep Graph Networks"
+        assert paper.publication_title == "TPAMI"
+        assert paper.publication_date.year == 2021
+        assert paper.check == 1
@@ -16,6 +16,10 @@ from utils.objfilter import (
     _collect_paths,
     _apply_keep,
     _apply_exclude,
+    compile_spec,
+    CompiledSpec,
+    filter_many,
+    compile_filter,
 )
 
 
@@ -641,3 +645,159 @@ class TestApplyKeepAndExclude:
 
         assert "references" in result
         assert len(result["references"]) == 2  # One less than original
+
+    def test_apply_keep_without_copy_shares_values(self, sample_data):
+        """Test _apply_keep without copying shares kept subtrees"""
+        mask = {"venue": True, "authors": {":": {"name": True}}}
+        result = _apply_keep(sample_data, mask, copy_values=False)
+
+        assert result["venue"] is sample_data["venue"]
+        assert result["authors"] is not sample_data["authors"]
+        assert result == _apply_keep(sample_data, mask)
+
+    def test_apply_keep_without_copy_true_mask(self, sample_data):
+        """Test _apply_keep without copying still returns a new top level"""
+        result = _apply_keep(sample_data, True, copy_values=False)
+        assert result == sample_data
+        assert result is not sample_data
+
+    def test_apply_exclude_without_copy_shares_values(self, sample_data):
+        """Test _apply_exclude without copying shares untouched subtrees"""
+        mask = {"abstract": True}
+        result = _apply_exclude(sample_data, mask, copy_values=False)
+
+        assert result["venue"] is sample_data["venue"]
+        assert result == _apply_exclude(sample_data, mask)
+
+
+class TestCompileSpec:
+    """Test compiling specs once for repeated filtering"""
+
+    def test_compile_keep_spec(self):
+        """Test a keep spec compiles to its mask"""
+        compiled = compile_spec({"keep": ["[title]", "[authors][:][name]"]})
+        assert compiled.mode == "keep"
+        assert compiled.mask == {"title": True, "authors": {":": {"name": True}}}
+
+    def test_compile_exclude_spec(self):
+        """Test an exclude spec compiles to its mask"""
+        compiled = compile_spec({"exclude": ["[abstract]"]})
+        assert compiled.mode == "exclude"
+        assert compiled.mask == {"abstract": True}
+
+    def test_keep_takes_priority(self):
+        """Test keep wins over exclude like in filter_structure"""
+        compiled = compile_spec({"keep": ["[title]"], "exclude": ["[title]"]})
+        assert compiled.mode == "keep"
+
+    @pytest.mark.parametrize("spec", [None, {}, {"keep": []}, "invalid"])
+    def test_compile_noop_spec(self, spec):
+        """Test specs without paths compile to a no-op"""
+        assert compile_spec(spec) == CompiledSpec("noop")
+
+    def test_compiled_spec_passes_through(self):
+        """Test compiling a compiled spec returns it unchanged"""
+        compiled = compile_spec({"keep": ["[title]"]})
+        assert compile_spec(compiled) is compiled
+
+    def test_same_paths_share_mask(self):
+        """Test equal specs reuse one compiled mask"""
+        first = compile_spec({"keep": ["[title]", "[year]"]})
+        second = compile_spec({"keep": ["[title]", "[year]"]})
+        assert first.mask is second.mask
+
+
+class TestFilterMany:
+    """Test filtering many objects with one spec"""
+
+    def test_filter_many_keep(self):
+        """Test every object is filtered by the spec"""
+        objs = [{"id": i, "title": f"t{i}", "abstract": "a"} for i in range(3)]
+        result = filter_many(objs, {"keep": ["[id]", "[title]"]})
+        assert result == [{"id": i, "title": f"t{i}"} for i in range(3)]
+
+    def test_filter_many_exclude(self):
+        """Test exclude specs work on every object"""
+        objs = [{"id": 1, "abstract": "a"}, {"id": 2}]
+        result = filter_many(objs, {"exclude": ["[abstract]"]})
+        assert result == [{"id": 1}, {"id": 2}]
+
+    def test_filter_many_accepts_iterables(self):
+        """Test a generator of objects can be filtered"""
+        objs = ({"id": i, "x": i} for i in range(2))
+        result = filter_many(objs, compile_spec({"keep": ["[id]"]}))
+        assert result == [{"id": 0}, {"id": 1}]
+
+    def test_filter_many_noop_spec(self):
+        """Test objects pass through unchanged without a spec"""
+        objs = [{"id": 1}]
+        assert filter_many(objs, None) == objs
+
+    def test_filter_many_noop_spec_copies(self):
+        """Test objects are copied without a spec by default"""
+        objs = [{"id": 1, "tags": ["a"]}]
+        result = filter_many(objs, None)
+        assert result[0] is not objs[0]
+        assert result[0]["tags"] is not objs[0]["tags"]
+
+    def test_filter_many_noop_spec_shares(self):
+        """Test copy_on_noop=False passes the objects through as they are"""
+        objs = [{"id": 1, "tags": ["a"]}]
+        result = filter_many(objs, {}, copy_on_noop=False)
+        assert result[0] is objs[0]
+
+
+class TestCompileFilter:
+    """Test filters generated from a spec"""
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            {"keep": ["[title]", "[authors][:][name]"]},
+            {"keep": ["[authors][0]", "[authors][5][name]", "[venue][name]"]},
+            {"exclude": ["[abstract]", "[authors][:][affiliation]"]},
+            {"exclude": ["[authors][1]", "[venue][type]"]},
+        ],
+    )
+    def test_matches_filter_structure(self, sample_data, spec):
+        """Test the generated filter gives the generic walk's result"""
+        compiled = compile_spec(spec)
+        walk = _apply_keep if compiled.mode == "keep" else _apply_exclude
+        expected = walk(sample_data, compiled.mask)
+        assert compile_filter(spec)(sample_data) == expected
+        assert compile_filter(spec, copy=False)(sample_data) == expected
+
+    def test_copies_kept_values(self, sample_data):
+        """Test kept subtrees are copies by default"""
+        result = compile_filter({"keep": ["[venue]"]})(sample_data)
+        assert result["venue"] == sample_data["venue"]
+        assert result["venue"] is not sample_data["venue"]
+
+    def test_without_copy_shares_values(self, sample_data):
+        """Test copy=False shares kept subtrees with the input"""
+        result = compile_filter({"keep": ["[venue]"]}, copy=False)(sample_data)
+        assert result["venue"] is sample_data["venue"]
+
+    def test_other_types_use_generic_walk(self):
+        """Test inputs other than plain dicts and lists are still filtered"""
+
+        class Record(dict):
+            pass
+
+        keep = compile_filter({"keep": ["[id]"]})
+        assert keep(Record(id=1, title="t")) == {"id": 1}
+        assert keep("text") == "text"
+
+    def test_keep_nothing(self, sample_data):
+        """Test keep paths without tokens keep nothing of containers"""
+        keep = compile_filter({"keep": ["title"]})
+        assert keep(sample_data) == {}
+        assert keep([1, 2]) == []
+        assert keep("text") == "text"
+
+    def test_noop_spec_copies(self):
+        """Test a spec without paths copies the input"""
+        obj = {"id": [1]}
+        result = compile_filter(None)(obj)
+        assert result == obj
+        assert result is not obj
@@ -0,0 +1,119 @@
+# type: ignore
+import pytest
+import pickle
+import sys
+import os
+import time
+
+# Add the parent directory to the path so we can import our modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cache
+from cache import Cacher, make_cache_key
+from T import IEEEAuthor, PaperMetaData
+from utils import (
+    persistent_memoize,
+    _compute_author_check,
+    _compute_paper_check,
+)
+
+
+class FakePage:
+    """Stands in for a page object: counts fetches of its id"""
+
+    def __init__(self, page_id, cacher=None, cache_ttl=None):
+        self.page_id = page_id
+        self.cacher = cacher
+        self.cache_ttl = cache_ttl
+        self.fetches = 0
+
+    @persistent_memoize("fake", "page_id")
+    def fetch(self):
+        self.fetches += 1
+        return f"info {self.page_id}"
+
+
+class TestPersistentMemoize:
+    """Test caching page results in the page's own cacher"""
+
+    def test_second_page_served_from_cache(self, tmp_path):
+        """Test a result fetched once is served to the next page object"""
+        cacher = Cacher(cache_dir=str(tmp_path))
+        first = FakePage("1", cacher)
+        second = FakePage("1", cacher)
+
+        assert first.fetch() == "info 1"
+        assert second.fetch() == "info 1"
+        assert (first.fetches, second.fetches) == (1, 0)
+
+    def test_key_shared_with_cli(self, tmp_path):
+        """Test entries use the CLI's make_cache_key scheme"""
+        cacher = Cacher(cache_dir=str(tmp_path))
+        FakePage("1", cacher).fetch()
+        assert cacher.load(make_cache_key("fake", {"page_id": "1"})) == "info 1"
+
+    def test_ttl_is_the_pages(self, tmp_path):
+        """Test results are saved with the page's cache_ttl"""
+        cacher = Cacher(cache_dir=str(tmp_path))
+        FakePage("1", cacher, cache_ttl=5).fetch()
+
+        path = cacher._filename(make_cache_key("fake", {"page_id": "1"}))
+        with open(path, "rb") as f:
+            assert pickle.load(f)["ttl"] == 5
+
+    def test_shorter_ttl_skips_older_entry(self, tmp_path, monkeypatch):
+        """Test an entry older than the page's cache_ttl is fetched again"""
+        cacher = Cacher(cache_dir=str(tmp_path))
+        FakePage("1", cacher, cache_ttl=86400).fetch()
+        now = time.time()
+        monkeypatch.setattr(cache.time, "time", lambda: now + 10)
+        fresh = FakePage("1", cacher, cache_ttl=5)
+        cached = FakePage("1", cacher)
+
+        fresh.fetch()
+        cached.fetch()
+        assert (fresh.fetches, cached.fetches) == (1, 0)
+
+    def test_no_cacher_no_cache(self, tmp_path):
+        """Test pages without a cacher always fetch"""
+        page = FakePage("1")
+        page.fetch()
+        page.fetch()
+        assert page.fetches == 2
+
+
+class TestCheckFlags:
+    """Test the check flags need every tracked field set"""
+
+    PAPER = {
+        "title": "Deep Graph Networks",
+        "abstract": "An abstract",
+        "authors": [IEEEAuthor(author_id="A1")],
+        "doi": "10.1000/P1",
+        "publication_title": "TPAMI",
+    }
+    AUTHOR = {"name": "Alice", "affiliation": ["MIT"], "publication_ids": ["P1"]}
+
+    def test_complete_records(self):
+        """Test fully populated records are checked"""
+        assert _compute_paper_check(PaperMetaData(**self.PAPER)) == 1
+        assert _compute_author_check(IEEEAuthor(**self.AUTHOR)) == 1
+
+    @pytest.mark.parametrize("field", [*PAPER, "publication_date"])
+    def test_paper_missing_field(self, field):
+        """Test any unset paper field clears the flag"""
+        paper = PaperMetaData(**self.PAPER)
+        setattr(paper, field, None)
+        assert _compute_paper_check(paper) == 0
+
+    @pytest.mark.parametrize("field", [*AUTHOR])
+    def test_author_missing_field(self, field):
+        """Test any unset author field clears the flag"""
+        author = IEEEAuthor(**self.AUTHOR)
+        setattr(author, field, [] if field != "name" else "")
+        assert _compute_author_check(author) == 0
+
+    def test_not_a_record(self):
+        """Test objects without the fields are unchecked"""
+        assert _compute_paper_check(object()) == 0
+        assert _compute_author_check(object()) == 0
@@ -1,17 +1,40 @@
 from dataclasses import asdict, fields
 from datetime import datetime
+import contextlib
+import functools
+import itertools
+import operator
+import queue
 import random
-from playwright.sync_api import Page
+import time
+from playwright.sync_api import Browser, BrowserContext, Page, Route
 from playwright.sync_api import Error
 import typing
+from cache import make_cache_key
 
 
 T = typing.TypeVar("T")
 
+# fields behind the check flags, read in one C call
+_author_check_fields = operator.attrgetter("name", "affiliation", "publication_ids")
+# same order as the _compute_*_check_from_fields parameters
+_paper_check_fields = operator.attrgetter(
+    "title", "abstract", "authors", "doi", "publication_title", "publication_date"
+)
 
+# values to_dict passes through unchanged
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# resources the scrapers never read; stylesheets stay since inner_text
+# depends on the rendered layout, scripts stay since the pages render with JS
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_time_with_backoff(time_str: str) -> typing.Optional[datetime]:
     """
     Parse a date string with exponential backoff.
+    Results are cached: publication dates repeat a lot and strptime is slow.
     """
     formats = ["%d %B %Y", "%B %Y", "%Y"]
     for fmt in formats:
@@ -23,21 +46,47 @@ def parse_time_with_backoff(time_str: str) -> typing.Optional[datetime]:
 
 
 def to_dict(obj):
-    # convert dataclass/datetime/list/dict recursively to JSON-serializable
-    if obj is None:
-        return None
-    if isinstance(obj, datetime):
-        return obj.strftime("%d %B %Y")
-    if hasattr(obj, "__dataclass_fields__"):
-        return to_dict(asdict(obj))
-    if isinstance(obj, dict):
-        return {k: to_dict(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple, set)):
-        return [to_dict(i) for i in obj]
-    if hasattr(obj, "__dict__"):
-        d = obj.__dict__.copy()
-        return {k: to_dict(v) for k, v in d.items()}
-    return obj
+    # convert dataclass/datetime/list/dict recursively to JSON-serializable;
+    # walks with an explicit stack, each entry carrying the container and slot
+    # its result goes to, so deep nesting costs no Python frames
+    if type(obj) in _JSON_SCALAR_TYPES:
+        return obj
+    root = [None]
+    stack = [(root, 0, obj)]
+    while stack:
+        parent, slot, obj = stack.pop()
+        if obj is None:
+            # slots start out as None
+            continue
+        if isinstance(obj, datetime):
+            parent[slot] = obj.strftime("%d %B %Y")
+            continue
+        if hasattr(obj, "__dataclass_fields__"):
+            obj = asdict(obj)
+        elif not isinstance(obj, (dict, list, tuple, set)) and hasattr(
+            obj, "__dict__"
+        ):
+            obj = obj.__dict__.copy()
+        # flat lists/dicts of scalars, e.g. affiliations or ids, are copied
+        # whole instead of pushing every element
+        if type(obj) is list and all(type(v) in _JSON_SCALAR_TYPES for v in obj):
+            parent[slot] = obj[:]
+        elif type(obj) is dict and all(
+            type(v) in _JSON_SCALAR_TYPES for v in obj.values()
+        ):
+            parent[slot] = obj.copy()
+        elif isinstance(obj, dict):
+            out = parent[slot] = {}
+            for k, v in obj.items():
+                out[k] = None
+                stack.append((out, k, v))
+        elif isinstance(obj, (list, tuple, set)):
+            out = parent[slot] = [None] * len(obj)
+            for i, v in enumerate(obj):
+                stack.append((out, i, v))
+        else:
+            parent[slot] = obj
+    return root[0]
 
 
 def random_wait(page: Page, min_seconds=2, max_seconds=5):
@@ -55,21 +104,132 @@ def remove_none(s: typing.Optional[T], default_value: T) -> T:
 
 
 def retry_with_exponential_backoff(func, max_retries=3, base_delay=2):
-    import time
-
     for attempt in range(max_retries):
         try:
             return func()
         except Error as e:
             if attempt == max_retries - 1:
                 raise e
-            delay = base_delay * (2**attempt)
+            delay = base_delay * (1 << attempt)
             print(
                 f"Playwright NetWork Error, R: ({attempt + 1}/{max_retries}), W{delay}: {e}"
             )
             time.sleep(delay)
 
 
+def _abort_blocked_resources(route: Route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def open_page(browser: Browser | BrowserContext) -> Page:
+    """
+    Open a new page that doesn't download images, media or fonts. Pages of a
+    BrowserContext share its cookies and HTTP cache; a Browser gives each
+    page a fresh context.
+    """
+    page = browser.new_page()
+    page.route("**/*", _abort_blocked_resources)
+    return page
+
+
+class PagePool:
+    """
+    Bounded pool of reusable browser pages.
+    Pages are handed out by acquire() (or borrow() as a context manager) and
+    reset to about:blank on release(), so the next user skips page construction.
+    Pages opened from a Browser also get their cookies cleared so they don't
+    inherit the previous user's state; pages of a shared BrowserContext keep
+    the session on purpose.
+    At most `size` idle pages are kept; extra released pages are closed.
+    """
+
+    def __init__(self, browser: Browser | BrowserContext, size: int = 8):
+        self.browser = browser
+        self._shared_context = isinstance(browser, BrowserContext)
+        self._idle: queue.Queue[Page] = queue.Queue(maxsize=size)
+
+    def acquire(self) -> Page:
+        while True:
+            try:
+                page = self._idle.get_nowait()
+            except queue.Empty:
+                return open_page(self.browser)
+            if not page.is_closed():
+                return page
+
+    def release(self, page: Page) -> None:
+        if page.is_closed():
+            return
+        try:
+            page.goto("about:blank")
+            if not self._shared_context:
+                page.context.clear_cookies()
+            self._idle.put_nowait(page)
+        except (Error, queue.Full):
+            page.close()
+
+    @contextlib.contextmanager
+    def borrow(self) -> typing.Iterator[Page]:
+        page = self.acquire()
+        try:
+            yield page
+        finally:
+            self.release(page)
+
+    def close(self) -> None:
+        """Close every idle page."""
+        while True:
+            try:
+                page = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if not page.is_closed():
+                page.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def persistent_memoize(namespace: str, key_attr: str):
+    """
+    Cache a method's non-None results in the instance's `cacher` (a
+    cache.Cacher; None disables caching), keyed by namespace and the instance
+    attribute key_attr, e.g. the id of the page object. A hit returns without
+    running the method at all.
+    Results are saved with the instance's `cache_ttl` (None: the cacher's
+    default), and entries older than it are not served, so a short TTL such
+    as 0 forces a fresh fetch.
+    The key is make_cache_key(namespace, {key_attr: value}), the same scheme
+    the CLI uses, so entries are shared with its caches.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            cacher = self.cacher
+            if cacher is None:
+                return fn(self, *args, **kwargs)
+            ttl = self.cache_ttl
+            key = make_cache_key(namespace, {key_attr: getattr(self, key_attr)})
+            cached = cacher.load(key, max_age=ttl)
+            if cached is not None:
+                return cached
+            result = fn(self, *args, **kwargs)
+            if result is not None:
+                cacher.save(key, result, ttl=ttl)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 def get_dataclass_field_count_by_type(cls) -> int:
     """get total num of a given dataclass type"""
     if hasattr(cls, "__dataclass_fields__"):
@@ -79,42 +239,50 @@ def get_dataclass_field_count_by_type(cls) -> int:
 
 
 def _is_default(val):
+    # an unset field value; all of them are falsy, so the check helpers below
+    # test truthiness inline instead
     return val is None or val == "" or val == [] or val == {}
 
 
+def _compute_author_check_from_fields(name, affiliation, publication_ids) -> int:
+    """Author check from raw field values, without building an IEEEAuthor."""
+    return 1 if name and affiliation and publication_ids else 0
+
+
 def _compute_author_check(author):
-    name = getattr(author, "name", None)
-    aff = getattr(author, "affiliation", None)
-    pubids = getattr(author, "publication_ids", None)
-    return (
-        1
-        if (not _is_default(name) and not _is_default(aff) and not _is_default(pubids))
-        else 0
-    )
+    try:
+        fields = _author_check_fields(author)
+    except AttributeError:
+        return 0
+    return _compute_author_check_from_fields(*fields)
 
 
-def _compute_paper_check(paper):
-    title = getattr(paper, "title", None)
-    abstract = getattr(paper, "abstract", None)
-    pubdate = getattr(paper, "publication_date", None)
-    doi = getattr(paper, "doi", None)
-    pubtitle = getattr(paper, "publication_title", None)
-    authors = getattr(paper, "authors", None)
+def _compute_paper_check_from_fields(
+    title, abstract, authors, doi, publication_title, publication_date
+) -> int:
+    """Paper check from raw field values, without building a PaperMetaData."""
     return (
         1
         if (
-            not _is_default(title)
-            and not _is_default(abstract)
-            and not _is_default(pubdate)
-            and not _is_default(doi)
-            and not _is_default(pubtitle)
+            title
+            and abstract
+            and publication_date
+            and doi
+            and publication_title
             and authors
-            and len(authors) > 0
         )
         else 0
     )
 
 
+def _compute_paper_check(paper):
+    try:
+        fields = _paper_check_fields(paper)
+    except AttributeError:
+        return 0
+    return _compute_paper_check_from_fields(*fields)
+
+
 def parse_selection(s: str, max_index: int) -> list[int]:
     """
     Parse selection string like "1,2-4,9-10".
@@ -124,26 +292,30 @@ def parse_selection(s: str, max_index: int) -> list[int]:
     if s is None or s.strip() == "":
         return list(range(1, max_index + 1))
     parts = [p.strip() for p in s.split(",") if p.strip()]
-    indices = set()
+    # collect (start, end) segments and merge them, so a huge range costs one
+    # tuple until the result is built
+    segments = []
     for p in parts:
-        if "-" in p:
-            try:
+        try:
+            if "-" in p:
                 a_str, b_str = p.split("-", 1)
                 a = int(a_str)
                 b = int(b_str)
                 if a > b:
                     a, b = b, a
-                for i in range(max(1, a), min(max_index, b) + 1):
-                    indices.add(i)
-            except Exception:
-                # ignore invalid segment
-                continue
+            else:
+                a = b = int(p)
+        except Exception:
+            # ignore invalid segment/token
+            continue
+        lo, hi = max(1, a), min(max_index, b)
+        if lo <= hi:
+            segments.append((lo, hi))
+    segments.sort()
+    merged: list[list[int]] = []
+    for lo, hi in segments:
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], hi)
         else:
-            try:
-                i = int(p)
-                if 1 <= i <= max_index:
-                    indices.add(i)
-            except Exception:
-                # ignore invalid token
-                continue
-    return sorted(indices)
+            merged.append([lo, hi])
+    return list(itertools.chain.from_iterable(range(lo, hi + 1) for lo, hi in merged))
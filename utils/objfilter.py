@@ -1,126 +1,482 @@
 import copy
+import functools
+import pickle
 import re
 import typing
+from dataclasses import dataclass
 
+# one dot-separated token of a field path, by the shape of its brackets
+_FIELD_TOKEN_RE = re.compile(
+    r"""
+    (?P<each>[^.]*)\[\](?=\.|\Z)                                   # name[]
+    | (?P<all>[^.\[]*)\[(?:[^.]*\[)?:\]?(?=\.|\Z)                  # name[:] or name[:
+    | (?=[^.]*\])(?P<name>[^.\[]*)\[(?P<index>[^.]*?)\]*(?=\.|\Z)  # name[0]
+    | (?P<plain>[^.]+)                                             # name
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+# entries kept by the path parsing caches below
+_PATH_CACHE_SIZE = 4096
+# immutable leaves that copy.deepcopy would hand back unchanged anyway
+_ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes})
 
-def _parse_path(path: str):
+
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
+def _path_tokens(path: str) -> tuple:
     # extract tokens inside [...] and convert numeric tokens to int, ':' stays as ':'
-    toks = re.findall(r"\[([^\]]*)\]", path)
-    res = []
-    for t in toks:
-        if t == ":":
-            res.append(":")
-        else:
-            if t.isdigit():
-                res.append(int(t))
-            else:
-                res.append(t)
-    return res
-
-
-def _add_path(mask: dict, tokens: list):
-    # set leaf to True to indicate keep/remove whole subtree
-    if not tokens:
-        return
-    key = tokens[0]
-    if key not in mask:
-        mask[key] = {}
-    if len(tokens) == 1:
-        mask[key] = True
-        return
-    if mask[key] is True:
-        # already whole subtree
-        return
-    _add_path(mask[key], tokens[1:])
+    # cached: specs repeat the same paths; a tuple so callers can't mutate it.
+    # Scanned with str.find, which beats a findall regex on these short paths.
+    tokens = []
+    start = path.find("[")
+    while start != -1:
+        end = path.find("]", start + 1)
+        if end == -1:
+            break
+        tok = path[start + 1 : end]
+        tokens.append(int(tok) if tok.isdecimal() else tok)
+        start = path.find("[", end + 1)
+    return tuple(tokens)
+
+
+def _parse_path(path: str):
+    return list(_path_tokens(path))
 
 
 def _build_mask(paths: list) -> dict:
+    # trie of path tokens; a True leaf keeps/removes the whole subtree, so a
+    # parent path overrides its children whichever comes first
     mask = {}
     for p in paths or []:
-        toks = _parse_path(p)
-        if toks:
-            _add_path(mask, toks)
+        toks = _path_tokens(p)
+        if not toks:
+            continue
+        node = mask
+        for key in toks[:-1]:
+            node = node.setdefault(key, {})
+            if node is True:
+                # already whole subtree
+                break
+        else:
+            node[toks[-1]] = True
     return mask
 
 
-def _apply_keep(obj, mask):
-    # if mask True -> keep whole obj
-    if mask is True:
-        return copy.deepcopy(obj)
-    if isinstance(obj, dict):
-        out = {}
-        for k, sub in mask.items():
-            # only keep keys specified in mask
-            if k in obj:
-                res = _apply_keep(obj[k], sub)
-                out[k] = res
-        return out
-    if isinstance(obj, list):
-        out = []
-        # support ':' for all elements
-        if ":" in mask:
-            sub = mask[":"]
-            for item in obj:
-                out.append(_apply_keep(item, sub))
-            return out
-        # or specific indices
-        for k, sub in mask.items():
-            if isinstance(k, int) and 0 <= k < len(obj):
-                out.append(_apply_keep(obj[k], sub))
-        return out
-    # primitive
-    return copy.deepcopy(obj)
-
-
-def _apply_exclude(obj, mask):
-    # if mask True -> remove whole object
+class _MaskNode:
+    """
+    Trie node compiled from a mask dict (see _build_mask) for the filter walk.
+    children maps each key to True (whole subtree) or another node, in the
+    mask's order; what the walk asks of it per container is precomputed:
+    the ':' child, the keys of a flat node and the integer keys.
+    Whole subtrees stay the True singleton rather than a terminal node: the
+    walk tells them apart with one identity test, cheaper than an attribute.
+    """
+
+    __slots__ = ("children", "each", "flat_keys", "int_items")
+
+    def __init__(self, children: dict):
+        self.children = children
+        self.each = children.get(":")
+        self.flat_keys = (
+            tuple(children) if all(v is True for v in children.values()) else None
+        )
+        self.int_items = tuple(
+            (k, v) for k, v in children.items() if isinstance(k, int)
+        )
+
+
+def _to_mask_node(mask, interned: dict):
+    # post-order: equal subtrees map to one shared node, so a child's id
+    # stands for its whole structure in the parent's intern key
+    if not isinstance(mask, dict):
+        return mask
+    children = {k: _to_mask_node(v, interned) for k, v in mask.items()}
+    key = tuple((k, v is True, id(v)) for k, v in children.items())
+    node = interned.get(key)
+    if node is None:
+        node = interned[key] = _MaskNode(children)
+    return node
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_mask(paths: tuple) -> dict:
+    # masks are only read, so one per distinct path list is shared by every
+    # filter_structure call with that spec, e.g. once per streamed record
+    return _build_mask(paths)  # type: ignore
+
+
+@functools.lru_cache(maxsize=128)
+def _compiled_trie(paths: tuple) -> _MaskNode:
+    return _to_mask_node(_compiled_mask(paths), {})
+
+
+def _fast_deepcopy(value):
+    # a pickle round trip copies JSON-like data several times faster than
+    # copy.deepcopy; anything pickle can't handle still goes through deepcopy
+    try:
+        return pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return copy.deepcopy(value)
+
+
+def _copy(value):
+    # no copy at all for JSON scalars
+    return value if type(value) in _ATOMIC_TYPES else _fast_deepcopy(value)
+
+
+def _alias(value):
+    return value
+
+
+def _apply_keep(obj, mask, copy_values: bool = True):
+    # walk with an explicit stack instead of recursion: each entry carries the
+    # container and slot its result goes to, so deep or long inputs cost no
+    # Python frames. Slots are filled in place, keeping the mask's order.
+    # Children kept whole and scalar children are written directly, so only
+    # containers that still need filtering are pushed.
+    # Without copy_values kept subtrees and leaves are the input's own objects.
+    if mask is True and not copy_values:
+        # still a new top-level container
+        return copy.copy(obj)
+    dup = _copy if copy_values else _alias
+    if isinstance(mask, dict):
+        # a plain mask from _build_mask; compiled specs pass their trie
+        mask = _to_mask_node(mask, {})
+    root = [None]
+    stack = [(root, 0, obj, mask)]
+    while stack:
+        parent, slot, node, sub_mask = stack.pop()
+        # exact type first: plain dicts and lists skip the isinstance() walk
+        node_type = type(node)
+        # if mask True -> keep whole node
+        if sub_mask is True:
+            parent[slot] = dup(node)
+        elif (node_type is dict or isinstance(node, dict)) and sub_mask.flat_keys:
+            # every named key kept whole: one comprehension, no slots
+            parent[slot] = {k: dup(node[k]) for k in sub_mask.flat_keys if k in node}
+        elif node_type is dict or isinstance(node, dict):
+            out = {}
+            parent[slot] = out
+            for k, sub in sub_mask.children.items():
+                # only keep keys specified in mask
+                if k in node:
+                    v = node[k]
+                    if sub is True or type(v) in _ATOMIC_TYPES:
+                        out[k] = dup(v)
+                    else:
+                        out[k] = None
+                        stack.append((out, k, v, sub))
+        elif node_type is list or isinstance(node, list):
+            # support ':' for all elements
+            sub = sub_mask.each
+            if sub is True and node_type is list:
+                # every element kept whole: copy the list in one go
+                out = _fast_deepcopy(node) if copy_values else node[:]
+            elif sub is not None:
+                out = [None] * len(node)
+                # project dict elements on a flat sub-mask in one comprehension
+                keys = None if sub is True else sub.flat_keys
+                for i, item in enumerate(node):
+                    if keys is not None and isinstance(item, dict):
+                        out[i] = {k: dup(item[k]) for k in keys if k in item}
+                    elif type(item) in _ATOMIC_TYPES:
+                        out[i] = item
+                    else:
+                        stack.append((out, i, item, sub))
+            else:
+                # or specific indices
+                n = len(node)
+                picked = [(k, sub) for k, sub in sub_mask.int_items if 0 <= k < n]
+                out = [None] * len(picked)
+                for i, (k, sub) in enumerate(picked):
+                    item = node[k]
+                    if sub is True or type(item) in _ATOMIC_TYPES:
+                        out[i] = dup(item)
+                    else:
+                        stack.append((out, i, item, sub))
+            parent[slot] = out
+        else:
+            # primitive
+            parent[slot] = dup(node)
+    return root[0]
+
+
+def _apply_exclude(obj, mask, copy_values: bool = True):
+    # explicit stack like _apply_keep. A child is dropped when its mask is True
+    # or when it is None (excluding from a primitive yields the primitive), so
+    # that is decided before pushing and every pushed slot gets filled.
     if mask is True:
         return None
-    if isinstance(obj, dict):
-        out = {}
-        for k, v in obj.items():
-            if k in mask:
-                # if submask True -> exclude entire key
-                if mask[k] is True:
+    dup = _copy if copy_values else _alias
+    if isinstance(mask, dict):
+        # a plain mask from _build_mask; compiled specs pass their trie
+        mask = _to_mask_node(mask, {})
+    root = [None]
+    stack = [(root, 0, obj, mask)]
+    while stack:
+        parent, slot, node, sub_mask = stack.pop()
+        children = sub_mask.children
+        node_type = type(node)
+        if node_type is dict or isinstance(node, dict):
+            # shallow copy, then only touch the few keys the mask names
+            out = dict(node)
+            parent[slot] = out
+            for k, sub in children.items():
+                if k not in out:
                     continue
-                # else recurse
-                res = _apply_exclude(v, mask[k])
-                if res is None:
+                v = out[k]
+                # if submask True -> exclude entire key
+                if sub is True or v is None:
+                    del out[k]
                     continue
-                out[k] = res
-            else:
-                # keep as is
-                out[k] = copy.deepcopy(v)
-        return out
-    if isinstance(obj, list):
-        # if mask has ':' handle all elements
-        if ":" in mask:
-            sub = mask[":"]
+                # excluding from a scalar keeps it, and it is already in out
+                if type(v) not in _ATOMIC_TYPES:
+                    out[k] = None
+                    stack.append((out, k, v, sub))
+            # keep the rest as is, containers still need their own copy
+            if copy_values:
+                out.update(
+                    {
+                        k: _fast_deepcopy(v)
+                        for k, v in node.items()
+                        if type(v) not in _ATOMIC_TYPES and k not in children
+                    }
+                )
+        elif node_type is list or isinstance(node, list):
             out = []
-            for item in obj:
-                res = _apply_exclude(item, sub)
-                if res is not None:
-                    out.append(res)
-            return out
-        # otherwise mask may contain indices to exclude/sub-filter
-        out = []
-        for idx, item in enumerate(obj):
-            if idx in mask:
-                sub = mask[idx]
+            parent[slot] = out
+            # if mask has ':' handle all elements
+            sub = sub_mask.each
+            if sub is not None:
                 if sub is True:
-                    # exclude this index
                     continue
-                res = _apply_exclude(item, sub)
-                if res is not None:
-                    out.append(res)
+                # drop fields of dict elements on a flat sub-mask in one comprehension
+                drop = sub.children if sub.flat_keys is not None else None
+                for item in node:
+                    if drop is not None and isinstance(item, dict):
+                        out.append(
+                            {k: dup(v) for k, v in item.items() if k not in drop}
+                        )
+                    elif type(item) in _ATOMIC_TYPES:
+                        if item is not None:
+                            out.append(item)
+                    else:
+                        out.append(None)
+                        stack.append((out, len(out) - 1, item, sub))
+                continue
+            # otherwise mask may contain indices to exclude/sub-filter
+            for idx, item in enumerate(node):
+                if idx in children:
+                    sub = children[idx]
+                    # exclude this index
+                    if sub is True or item is None:
+                        continue
+                    if type(item) in _ATOMIC_TYPES:
+                        out.append(item)
+                    else:
+                        out.append(None)
+                        stack.append((out, len(out) - 1, item, sub))
+                else:
+                    out.append(dup(item))
+        else:
+            # primitive
+            parent[slot] = dup(node)
+    return root[0]
+
+
+def _kept_lines(target: str, expr: str, copy_values: bool, indent: str) -> list:
+    # `target = expr` for a value kept whole, copied like _copy does
+    if not copy_values:
+        return [f"{indent}{target} = {expr}"]
+    lines = [] if expr == "x" else [f"{indent}x = {expr}"]
+    lines.append(
+        f"{indent}{target} = x if type(x) in _ATOMIC_TYPES else _fast_deepcopy(x)"
+    )
+    return lines
+
+
+def _codegen_filter(trie: _MaskNode, mode: str, copy_values: bool):
+    # partial evaluation of _apply_keep/_apply_exclude over one trie: every
+    # node becomes a function of straight-line code with its keys inlined as
+    # literals, so filtering does no mask lookups or 'is True' tests.
+    # Only exact dicts and lists are specialized; anything else goes back to
+    # the generic walk with that node's mask.
+    env = {
+        "_ATOMIC_TYPES": _ATOMIC_TYPES,
+        "_fast_deepcopy": _fast_deepcopy,
+        "_walk": _apply_keep if mode == "keep" else _apply_exclude,
+        "_copy_values": copy_values,
+    }
+    names: dict = {}
+    pending = []
+
+    def name_of(node) -> str:
+        if id(node) not in names:
+            names[id(node)] = f"_f{len(names)}"
+            pending.append(node)
+        return names[id(node)]
+
+    src = []
+    tail = []
+    root = name_of(trie)
+    while pending:
+        node = pending.pop()
+        n = names[id(node)][2:]
+        env[f"_m{n}"] = node
+        src += [f"def _f{n}(o):", "    t = type(o)", "    if t is dict:"]
+        if mode == "keep" and not node.children:
+            # keeps nothing, e.g. paths without brackets: no lookups at all
+            src += [
+                "        return {}",
+                "    if t is list:",
+                "        return []",
+                "    if t in _ATOMIC_TYPES:",
+                "        return o",
+                f"    return _walk(o, _m{n}, _copy_values)",
+                "",
+            ]
+            continue
+        if mode == "keep":
+            src.append("        out = {}")
+            for k, sub in node.children.items():
+                src.append(f"        if {k!r} in o:")
+                if sub is True:
+                    target, expr = f"out[{k!r}]", f"o[{k!r}]"
+                    src += _kept_lines(target, expr, copy_values, " " * 12)
+                else:
+                    src.append(f"            out[{k!r}] = {name_of(sub)}(o[{k!r}])")
+        else:
+            src.append("        out = dict(o)")
+            for k, sub in node.children.items():
+                src.append(f"        if {k!r} in out:")
+                if sub is True:
+                    src.append(f"            del out[{k!r}]")
+                else:
+                    src += [
+                        f"            v = out[{k!r}]",
+                        "            if v is None:",
+                        f"                del out[{k!r}]",
+                        "            elif type(v) not in _ATOMIC_TYPES:",
+                        f"                out[{k!r}] = {name_of(sub)}(v)",
+                    ]
+            if copy_values:
+                env[f"_c{n}"] = frozenset(node.children)
+                src += [
+                    "        out.update({",
+                    "            k: _fast_deepcopy(v) for k, v in o.items()",
+                    f"            if type(v) not in _ATOMIC_TYPES and k not in _c{n}",
+                    "        })",
+                ]
+        src += ["        return out", "    if t is list:"]
+        each = node.each
+        if mode == "keep":
+            if each is True:
+                src.append(
+                    "        return _fast_deepcopy(o)"
+                    if copy_values
+                    else "        return o[:]"
+                )
+            elif each is not None:
+                src.append(
+                    "        return [x if type(x) in _ATOMIC_TYPES"
+                    f" else {name_of(each)}(x) for x in o]"
+                )
             else:
-                out.append(copy.deepcopy(item))
-        return out
-    # primitive
-    return copy.deepcopy(obj)
+                src += ["        n = len(o)", "        out = []"]
+                for k, sub in node.int_items:
+                    if k < 0:
+                        continue
+                    src.append(f"        if {k} < n:")
+                    if sub is True:
+                        src += _kept_lines("y", f"o[{k}]", copy_values, " " * 12)
+                        src.append("            out.append(y)")
+                    else:
+                        src.append(f"            out.append({name_of(sub)}(o[{k}]))")
+                src.append("        return out")
+        elif each is True:
+            src.append("        return []")
+        elif each is not None:
+            src.append(
+                "        return [x if type(x) in _ATOMIC_TYPES"
+                f" else {name_of(each)}(x) for x in o if x is not None]"
+            )
+        elif not node.int_items:
+            src.append(
+                "        return [x if type(x) in _ATOMIC_TYPES else _fast_deepcopy(x)"
+                " for x in o]"
+                if copy_values
+                else "        return o[:]"
+            )
+        else:
+            # index -> function for the element, None to drop it
+            tail.append(
+                f"_i{n} = {{"
+                + ", ".join(
+                    f"{k}: {'None' if sub is True else name_of(sub)}"
+                    for k, sub in node.int_items
+                )
+                + "}"
+            )
+            src += [
+                "        out = []",
+                "        for i, x in enumerate(o):",
+                f"            if i not in _i{n}:",
+            ]
+            src += _kept_lines("y", "x", copy_values, " " * 16)
+            src += [
+                "                out.append(y)",
+                "                continue",
+                f"            f = _i{n}[i]",
+                "            if f is not None and x is not None:",
+                "                out.append(x if type(x) in _ATOMIC_TYPES else f(x))",
+                "        return out",
+            ]
+        src += [
+            "    if t in _ATOMIC_TYPES:",
+            "        return o",
+            f"    return _walk(o, _m{n}, _copy_values)",
+            "",
+        ]
+    exec(compile("\n".join(src + tail), "<filter>", "exec"), env)
+    return env[root]
 
 
-def filter_structure(obj, spec: dict) -> typing.Tuple[typing.Any, int]:
+@functools.lru_cache(maxsize=128)
+def _trie_filter(trie: _MaskNode, mode: str, copy_values: bool):
+    return _codegen_filter(trie, mode, copy_values)
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    """
+    A filtering spec with its mask built, see compile_spec.
+    mode is "keep", "exclude" or "noop"; mask is None for "noop", trie is
+    the mask compiled for the filter walk.
+    """
+
+    mode: str
+    mask: typing.Optional[dict] = None
+    trie: typing.Optional[_MaskNode] = None
+
+
+def compile_spec(spec) -> CompiledSpec:
+    """
+    Build the mask of a spec once, so filtering many objects with it doesn't
+    re-parse its paths. A CompiledSpec is returned unchanged.
+    """
+    if isinstance(spec, CompiledSpec):
+        return spec
+    if not isinstance(spec, dict):
+        return CompiledSpec("noop")
+    for mode in ("keep", "exclude"):
+        if spec.get(mode):
+            paths = tuple(spec[mode])
+            return CompiledSpec(mode, _compiled_mask(paths), _compiled_trie(paths))
+    return CompiledSpec("noop")
+
+
+def filter_structure(
+    obj, spec: dict | CompiledSpec, copy: bool = True, *, copy_on_noop: bool = True
+) -> typing.Tuple[typing.Any, int]:
     """
     Filter a Python structure (dict/list/primitive) by spec:
      spec example:
@@ -130,17 +486,62 @@ def filter_structure(obj, spec: dict) -> typing.Tuple[typing.Any, int]:
       - If 'keep' present: result only contains fields specified by keep paths.
       - Else if 'exclude' present: result contains everything except fields matched by exclude paths.
       - Paths use bracket notation: [key], [index], [:] for all list elements.
+      - Without keep/exclude paths the result is a copy of obj, or obj itself
+        with copy_on_noop=False (or copy=False).
+     spec may also be a CompiledSpec from compile_spec, which saves rebuilding
+     the mask when the same spec filters many objects.
+     With copy=False the result's containers are new but every value kept
+     as is (leaves, subtrees kept whole) is shared with obj; use it when
+     neither is mutated afterwards, e.g. when the result is only serialized.
+    """
+    return _filter_compiled(obj, compile_spec(spec), copy, copy_on_noop)
+
+
+def _filter_compiled(
+    obj, compiled: CompiledSpec, copy: bool, copy_on_noop: bool
+) -> typing.Tuple[typing.Any, int]:
+    if compiled.mode == "noop":
+        # nothing to do
+        return (_copy(obj) if copy and copy_on_noop else obj), 0
+    trie = compiled.trie
+    if type(obj) is dict and (
+        # keep names every top-level key, in order
+        trie.flat_keys == tuple(obj)
+        if compiled.mode == "keep"
+        # exclude names none of them
+        else trie.children.keys().isdisjoint(obj)
+    ):
+        # the result equals obj: copy it whole instead of key by key
+        return (_fast_deepcopy(obj) if copy else dict(obj)), 1
+    return _trie_filter(trie, compiled.mode, copy)(obj), 1
+
+
+def filter_many(
+    objs: typing.Iterable, spec, copy: bool = True, *, copy_on_noop: bool = True
+) -> list:
+    """
+    Filter every object in objs by the same spec, compiled once.
+    Returns the filtered objects, without filter_structure's flag.
+    """
+    compiled = compile_spec(spec)
+    return [_filter_compiled(obj, compiled, copy, copy_on_noop)[0] for obj in objs]
+
+
+def compile_filter(
+    spec, copy: bool = True
+) -> typing.Callable[[typing.Any], typing.Any]:
     """
-    if not isinstance(spec, dict) or not spec:
-        return copy.deepcopy(obj), 0
-    if "keep" in spec and spec.get("keep"):
-        mask = _build_mask(spec.get("keep"))  # type: ignore
-        return _apply_keep(obj, mask), 1  # type: ignore
-    if "exclude" in spec and spec.get("exclude"):
-        mask = _build_mask(spec.get("exclude"))  # type: ignore
-        return _apply_exclude(obj, mask), 1  # type: ignore
-    # nothing to do
-    return copy.deepcopy(obj), 0
+    Turn a spec into a function filtering one object, generated as Python
+    code for the spec's paths, e.g. for {"keep": ["[id]", "[authors][:][name]"]}
+    roughly
+      lambda o: {"id": o["id"], "authors": [{"name": a["name"]} for a in ...]}
+    Results equal filter_structure(obj, spec, copy)[0]; without keep/exclude
+    paths the function returns a copy of obj (obj itself with copy=False).
+    """
+    compiled = compile_spec(spec)
+    if compiled.mode == "noop":
+        return _copy if copy else _alias
+    return _trie_filter(compiled.trie, compiled.mode, copy)
 
 
 def build_spec_from_args(args):
@@ -159,6 +560,18 @@ def build_spec_from_args(args):
     return spec if spec else None
 
 
+def _bracket_field_token(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind == "plain":
+        return f"[{m[kind]}]"
+    if kind == "index":
+        # e.g. authors[0] -> [authors][0]
+        return f"[{m['name']}][{m['index']}]"
+    # authors[], authors[:] and the incomplete authors[:
+    return f"[{m[kind]}][:]"
+
+
+@functools.lru_cache(maxsize=_PATH_CACHE_SIZE)
 def _field_to_bracket(path: str) -> str:
     """
     Convert convenient dot/array notation to bracket path.
@@ -169,50 +582,10 @@ def _field_to_bracket(path: str) -> str:
       "authors[0].name" -> "[authors][0][name]"
       "authors[:].name" -> "[authors][:][name]"
     """
-    parts = []
-    # split by '.' but keep any existing [...] tokens as part
-    tokens = []
-    buf = ""
-    for ch in path:
-        if ch == ".":
-            if buf != "":
-                tokens.append(buf)
-                buf = ""
-        else:
-            buf += ch
-    if buf != "":
-        tokens.append(buf)
-    for tok in tokens:
-        # handle token like name[], name[:], name[0]
-        if tok.endswith("[]"):
-            name = tok[:-2]
-            parts.append(f"[{name}]")
-            parts.append("[:]")
-        elif tok.endswith("[:]"):
-            # allow authors[:]
-            name = tok.split("[", 1)[0]
-            parts.append(f"[{name}]")
-            parts.append("[:]")
-        elif tok.endswith("[:") and not tok.endswith("[:]"):
-            # handle incomplete case like authors[:
-            name = tok.split("[", 1)[0]
-            parts.append(f"[{name}]")
-            parts.append("[:]")
-        elif "[" in tok and "]" in tok:
-            # keep as is, but ensure bracket positions are separate tokens
-            # e.g. authors[0] -> [authors][0]
-            name, rest = tok.split("[", 1)
-            index = rest.rstrip("]")
-            parts.append(f"[{name}]")
-            if index == ":":
-                parts.append("[:]")
-            elif index.isdigit():
-                parts.append(f"[{index}]")
-            else:
-                parts.append(f"[{index}]")
-        else:
-            parts.append(f"[{tok}]")
-    return "".join(parts)
+    if "[" not in path:
+        # plain dotted path: bracket every name, empty ones are dropped
+        return "".join([f"[{name}]" for name in path.split(".") if name])
+    return _FIELD_TOKEN_RE.sub(_bracket_field_token, path).replace(".", "")
 
 
 def _collect_paths(arg_list):
@@ -220,20 +593,12 @@ def _collect_paths(arg_list):
     Normalize input: arg_list can be None, list of strings possibly comma-separated.
     Return flattened list of bracket paths.
     """
-    if not arg_list:
-        return []
-    out = []
-    for entry in arg_list:
-        if entry is None:
-            continue
-        # support comma-separated values in one arg
-        for part in entry.split(","):
-            part = part.strip()
-            if not part:
-                continue
-            # if already looks like bracket path, keep
-            if part.startswith("["):
-                out.append(part)
-            else:
-                out.append(_field_to_bracket(part))
-    return out
+    # support comma-separated values in one arg; parts that already look like
+    # bracket paths are kept as is
+    return [
+        part if part.startswith("[") else _field_to_bracket(part)
+        for entry in arg_list or ()
+        if entry is not None
+        for part in map(str.strip, entry.split(","))
+        if part
+    ]